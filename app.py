@@ -6,7 +6,7 @@ import plotly.graph_objects as go
 from io import BytesIO
 import base64
 import os
-from utils.data_manager import load_data, validate_data, detect_column_types
+from utils.data_manager import load_data, validate_data
 from utils.visualizations import create_spend_chart, create_supplier_chart
 from utils.mock_data import get_mock_spend_data, get_mock_supplier_data, get_mock_contract_data, get_mock_performance_data
 from utils.template_generator import get_template_download_button
@@ -282,7 +282,7 @@ with st.sidebar.expander("📊 Smart Data Upload"):
     # Smart multiple file uploader
     uploaded_files = st.file_uploader(
         "Upload your procurement data files:",
-        type=["csv", "xlsx"],
+        type=["csv", "xlsx", "parquet", "feather"],
         accept_multiple_files=True
     )
     
@@ -322,14 +322,18 @@ with st.sidebar.expander("📊 Smart Data Upload"):
                 state_var = "spend_data"
             
             if detected_type:
-                # Load the file using the standard loader
-                data = load_data(uploaded_file, 'csv' if filename.endswith('.csv') else 'excel')
+                # Every rerun sees the same upload again; keep the frame already loaded from it, since a
+                # fresh copy would make pages that memoize on the data's identity rebuild each time
+                file_id_key = f"{state_var}_file_id"
+                if st.session_state.get(file_id_key) == uploaded_file.file_id:
+                    data = st.session_state.get(state_var)
+                else:
+                    # Load the file using the standard loader
+                    data = load_data(uploaded_file)
                 if data is not None:
                     # Store the data in session state
                     st.session_state[state_var] = data
-                    
-                    # Detect column types for dynamic UI
-                    detect_column_types(data)
+                    st.session_state[file_id_key] = uploaded_file.file_id
                     
                     # Store column types for dynamic UI generation
                     if hasattr(data, 'attrs') and 'column_types' in data.attrs:
@@ -354,6 +358,8 @@ with st.sidebar.expander("📊 Smart Data Upload"):
         st.session_state.supplier_data = get_mock_supplier_data()
         st.session_state.contract_data = get_mock_contract_data()
         st.session_state.performance_data = get_mock_performance_data()
+        for state_var in ("spend_data", "supplier_data", "contract_data", "performance_data"):
+            st.session_state.pop(f"{state_var}_file_id", None)
         st.success("✅ Reset to demonstration data")
         st.rerun()
 
@@ -3,9 +3,219 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from datetime import datetime, timedelta
 from utils.visualizations import apply_standard_legend_style
 
+# Spend tiers indexed by the tier ids returned from _rank_and_tier
+_TIER_LABELS = ("Standard", "Key", "Strategic")
+
+# Above this many suppliers, suppliers sharing a point in the segmentation matrix are sent as one marker
+_SEGMENTATION_DEDUPE_MIN = 5000
+
+# Above this many suppliers the segmentation matrix is drawn as a density grid instead of points
+_SEGMENTATION_AGGREGATE_MIN = 50000
+
+# Quadrant dividers and labels of the supplier segmentation matrix
+_QUADRANT_SHAPES = [
+    dict(type="line", xref="paper", x0=0, x1=1, yref="y", y0=7.5, y1=7.5, line=dict(width=1, dash="dash", color="gray")),
+    dict(type="line", xref="x", x0=60, x1=60, yref="paper", y0=0, y1=1, line=dict(width=1, dash="dash", color="gray"))
+]
+_QUADRANT_ANNOTATIONS = [
+    dict(x=80, y=8.75, text="Strategic", showarrow=False, font=dict(size=12, color="green")),
+    dict(x=30, y=8.75, text="Potential", showarrow=False, font=dict(size=12, color="blue")),
+    dict(x=80, y=3.75, text="Problematic", showarrow=False, font=dict(size=12, color="red")),
+    dict(x=30, y=3.75, text="Transactional", showarrow=False, font=dict(size=12, color="gray"))
+]
+
+# Static layout of the supplier segmentation matrix, shared by every render
+_SEGMENTATION_LAYOUT = dict(
+    title=dict(text="Supplier Segmentation Matrix"),
+    xaxis=dict(title=dict(text="Spend (Percentile)"), hoverformat=".1f"),
+    yaxis=dict(title=dict(text="Performance Score (1-10)"), hoverformat=".1f"),
+    legend=dict(
+        title=dict(text="Category"),
+        itemsizing="constant",
+        tracegroupgap=0,
+        orientation="h",       # Horizontal legend
+        yanchor="top",         # Anchor from top of legend box
+        y=-0.2,                # Position below the chart
+        xanchor="center",      # Center anchor
+        x=0.5                  # Center position
+    ),
+    margin=dict(l=20, r=20, t=50, b=100),  # Extra bottom margin
+    height=550                 # Taller chart
+)
+
+def _fmt_spend(values):
+    """Format an array of spend amounts as $X.XM / $X.XK / $X labels in one vectorized pass"""
+    values = np.asarray(values, dtype=float)
+    conditions = [values > 1000000, values > 1000]
+    choices = [
+        np.char.add(np.round(values / 1000000, 1).astype(str), "M"),
+        np.char.add(np.round(values / 1000, 1).astype(str), "K"),
+    ]
+    default = np.round(values).astype(np.int64).astype(str)
+    return np.char.add("$", np.select(conditions, choices, default=default))
+
+def _is_mobile_client():
+    """Best-effort check for a phone browser, based on the User-Agent of the current session"""
+    return "Mobi" in st.context.headers.get("User-Agent", "")
+
+def _rank_and_tier(totals):
+    """
+    Compute each supplier's spend percentile and spend tier
+    
+    Parameters:
+    totals: Array of total spend per supplier
+    
+    Returns:
+    tuple: (percentile of suppliers spending at most each total, int8 index into _TIER_LABELS)
+    """
+    totals = np.asarray(totals, dtype=np.float64)
+    percentiles = np.searchsorted(np.sort(totals), totals, side="right") / len(totals) * 100
+    tiers = (percentiles >= 50).astype(np.int8) + (percentiles >= 80)
+    return percentiles, tiers
+
+@st.cache_data
+def _history_long(supplier_history):
+    """Melt one supplier's quarterly scores into the long form used by the trend chart"""
+    metrics = ["OverallScore", "DeliveryScore", "QualityScore", "ResponsivenessScore"]
+    history_long = pd.melt(
+        supplier_history[["Quarter"] + metrics],
+        id_vars=["Quarter"],
+        value_vars=metrics,
+        var_name="Metric",
+        value_name="Score"
+    )
+    
+    # Create a more readable label for the metrics
+    history_long["Metric"] = history_long["Metric"].replace({
+        "OverallScore": "Overall",
+        "DeliveryScore": "Delivery",
+        "QualityScore": "Quality",
+        "ResponsivenessScore": "Responsiveness"
+    })
+    return history_long
+
+@st.cache_data
+def _spend_by(supplier_spend, column):
+    """Total one supplier's spend by the given column, largest first"""
+    spend_by = supplier_spend.groupby(column)["Amount"].sum().reset_index()
+    return spend_by.sort_values("Amount", ascending=False)
+
+@st.cache_data
+def _spend_by_month(supplier_spend):
+    """Total one supplier's spend per month, in chronological order"""
+    # Group on a monthly period key so only Amount is carried along and months sort by time;
+    # only the per-month result is formatted back to a label
+    month = pd.to_datetime(supplier_spend["Date"], cache=True).dt.to_period("M").rename("Month")
+    spend_by_month = supplier_spend["Amount"].groupby(month, sort=True).sum().reset_index()
+    spend_by_month["Month"] = spend_by_month["Month"].dt.strftime('%Y-%m')
+    return spend_by_month
+
+def _collapse_duplicate_points(plot_df):
+    """Merge suppliers of the same category that share segmentation coordinates into one point"""
+    grouped = plot_df.groupby(["Category", "SpendPercentile", "PerformanceScore"], sort=False)
+    collapsed = grouped.agg(
+        TotalSpend=("TotalSpend", "sum"),
+        SupplierName=("SupplierName", "first"),
+        Suppliers=("SupplierName", "size")
+    ).reset_index()
+    
+    # Merged points are sized by their combined spend and labelled with how many suppliers they hold
+    collapsed["SupplierName"] = np.where(
+        collapsed["Suppliers"] > 1,
+        collapsed["Suppliers"].astype(str) + " suppliers",
+        collapsed["SupplierName"]
+    )
+    collapsed["SpendLabel"] = _fmt_spend(collapsed["TotalSpend"].to_numpy())
+    return collapsed
+
+def _segmentation_traces(plot_df):
+    """Build one WebGL marker trace per supplier category for the segmentation matrix"""
+    if len(plot_df) > _SEGMENTATION_DEDUPE_MIN:
+        # At this scale many suppliers share coordinates; send each distinct point only once
+        plot_df = _collapse_duplicate_points(plot_df)
+    
+    # Encode categories once as integer codes (in order of first appearance) and split every
+    # plotted column by code, instead of slicing a sub-frame per category
+    codes, categories = pd.factorize(plot_df["Category"])
+    order = np.argsort(codes, kind="stable")
+    order = order[codes[order] >= 0]
+    bounds = np.searchsorted(codes[order], np.arange(1, len(categories)))
+    columns = {
+        column: np.split(plot_df[column].to_numpy()[order], bounds)
+        for column in ["SpendPercentile", "PerformanceScore", "TotalSpend", "SupplierName", "SpendLabel"]
+    }
+    
+    # One WebGL trace per category, coloured from the active template
+    colorway = pio.templates[pio.templates.default].layout.colorway or px.colors.qualitative.Plotly
+    sizeref = (plot_df["TotalSpend"].max() or 1) / 25 ** 2  # Largest supplier drawn at 25px
+    traces = []
+    for i, category in enumerate(categories):
+        traces.append(go.Scattergl(
+            x=columns["SpendPercentile"][i],
+            y=columns["PerformanceScore"][i],
+            mode="markers",
+            name=category,
+            legendgroup=category,
+            hovertext=columns["SupplierName"][i],
+            customdata=columns["SpendLabel"][i],
+            hovertemplate=(
+                "<b>%{hovertext}</b><br><br>Category=" + str(category) +
+                "<br>Spend (Percentile)=%{x}<br>Performance Score (1-10)=%{y}"
+                "<br>Total Spend=%{customdata}<extra></extra>"
+            ),
+            marker=dict(
+                color=colorway[i % len(colorway)],
+                size=columns["TotalSpend"][i],
+                sizemode="area",
+                sizeref=sizeref,
+                opacity=0.7
+            )
+        ))
+    return traces
+
+@st.cache_data
+def _segmentation_figure(plot_df):
+    """
+    Build the supplier segmentation matrix without any supplier highlighted
+    
+    Parameters:
+    plot_df: Segmentation data limited to the plotted columns
+    
+    Returns:
+    dict: The quadrant chart as a plain figure dict, cached until the plotted data changes
+    """
+    if len(plot_df) > _SEGMENTATION_AGGREGATE_MIN:
+        # Too many suppliers to send as points: bin them server-side and send only the grid
+        counts, x_edges, y_edges = np.histogram2d(
+            plot_df["SpendPercentile"].to_numpy(),
+            plot_df["PerformanceScore"].to_numpy(),
+            bins=(100, 50),
+            range=((0, 100), (0, 10))
+        )
+        traces = [go.Heatmap(
+            x=(x_edges[:-1] + x_edges[1:]) / 2,
+            y=(y_edges[:-1] + y_edges[1:]) / 2,
+            z=np.where(counts > 0, counts, np.nan).T,
+            colorscale="Oranges",
+            colorbar=dict(title=dict(text="Suppliers")),
+            hovertemplate="Spend (Percentile)=%{x}<br>Performance Score (1-10)=%{y}<br>Suppliers=%{z}<extra></extra>"
+        )]
+    else:
+        traces = _segmentation_traces(plot_df)
+    
+    # Build the whole figure in one pass, adding quadrant lines and annotations to the shared layout
+    fig7 = go.Figure(
+        data=traces,
+        layout=dict(_SEGMENTATION_LAYOUT, shapes=_QUADRANT_SHAPES, annotations=_QUADRANT_ANNOTATIONS)
+    )
+    
+    # Cache the plain dict: unpickling a cached Figure would re-run Plotly's validators on every hit
+    return fig7.to_dict()
+
 def show(session_state):
     """Display the Supplier Relationship Management tab content"""
     st.title("🤝 Supplier Relationship Management")
@@ -164,23 +374,21 @@ def show(session_state):
         supplier_contracts = contract_data[contract_data["SupplierID"] == selected_supplier_id]
         active_contracts = len(supplier_contracts[supplier_contracts["Status"] == "Active"])
         
+        # Rank every supplier's total spend once; reused by the segmentation overview below
+        all_suppliers_spend = spend_data.groupby("Supplier")["Amount"].sum()
+        spend_percentiles, spend_tiers = _rank_and_tier(all_suppliers_spend.to_numpy())
+        
         # Use a completely different approach for metrics - custom HTML/CSS cards
         # Determine supplier tier
         if len(supplier_spend) > 0:
-            spend_percentile = (spend_data.groupby("Supplier")["Amount"].sum() <= total_spend).mean() * 100
-            tier = "Strategic" if spend_percentile >= 80 else ("Key" if spend_percentile >= 50 else "Standard")
+            tier = _TIER_LABELS[spend_tiers[all_suppliers_spend.index.get_loc(supplier_details["SupplierName"])]]
             tier_color = "#FF6B35" if tier == "Strategic" else ("#FFA07A" if tier == "Key" else "#E9967A")
         else:
             tier = "Unknown"
             tier_color = "#A9A9A9"
             
         # Format spend amount
-        if total_spend > 1000000:
-            spend_display = f"${total_spend/1000000:.1f}M"
-        elif total_spend > 1000:
-            spend_display = f"${total_spend/1000:.1f}K"
-        else:
-            spend_display = f"${total_spend:.0f}"
+        spend_display = str(_fmt_spend([total_spend])[0])
         
         # Format overall score
         score_display = f"{overall_score:.1f}" if isinstance(overall_score, (int, float)) else "N/A"
@@ -259,8 +467,9 @@ def show(session_state):
             {"name": "Responsiveness", "score": responsiveness_score}
         ]
         
+        indicators = []
         for i, metric in enumerate(metrics):
-            fig1.add_trace(go.Indicator(
+            indicators.append(go.Indicator(
                 mode="number+gauge",
                 value=metric["score"],
                 domain={'x': [0, 1], 'y': [i/len(metrics), (i+0.8)/len(metrics)]},
@@ -285,14 +494,18 @@ def show(session_state):
                 }
             ))
         
-        fig1.update_layout(
-            height=300,
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="white"),
-        )
-        # Apply standardized horizontal legend style
-        apply_standard_legend_style(fig1)
+        # Add all bullet charts and apply the layout as one batch of figure updates
+        with fig1.batch_update():
+            fig1.add_traces(indicators)
+            
+            fig1.update_layout(
+                height=300,
+                paper_bgcolor="rgba(0,0,0,0)",
+                plot_bgcolor="rgba(0,0,0,0)",
+                font=dict(color="white"),
+            )
+            # Apply standardized horizontal legend style
+            apply_standard_legend_style(fig1)
         
         st.plotly_chart(fig1, use_container_width=True, key="performance_score_chart")
     
@@ -306,22 +519,7 @@ def show(session_state):
         
         if len(supplier_history) > 0:
             # Create a long format dataframe for the line chart
-            metrics = ["OverallScore", "DeliveryScore", "QualityScore", "ResponsivenessScore"]
-            history_long = pd.melt(
-                supplier_history,
-                id_vars=["SupplierID", "Quarter"],
-                value_vars=metrics,
-                var_name="Metric",
-                value_name="Score"
-            )
-            
-            # Create a more readable label for the metrics
-            history_long["Metric"] = history_long["Metric"].replace({
-                "OverallScore": "Overall",
-                "DeliveryScore": "Delivery",
-                "QualityScore": "Quality",
-                "ResponsivenessScore": "Responsiveness"
-            })
+            history_long = _history_long(supplier_history)
             
             # Create the trend chart
             fig2 = px.line(
@@ -374,8 +572,7 @@ def show(session_state):
             
             with spend_col1:
                 # Spend by category
-                spend_by_category = supplier_spend.groupby("Category")["Amount"].sum().reset_index()
-                spend_by_category = spend_by_category.sort_values("Amount", ascending=False)
+                spend_by_category = _spend_by(supplier_spend, "Category")
                 
                 fig3 = px.pie(
                     spend_by_category,
@@ -404,10 +601,8 @@ def show(session_state):
                 st.plotly_chart(fig3, use_container_width=True, key="spend_category_chart")
             
             with spend_col2:
-                # Spend trend over time - use proper DataFrame methods to avoid warnings
-                supplier_spend = supplier_spend.copy()  # Create a copy to avoid the SettingWithCopyWarning
-                supplier_spend.loc[:, "Month"] = pd.to_datetime(supplier_spend["Date"]).dt.strftime('%Y-%m')
-                spend_by_month = supplier_spend.groupby("Month")["Amount"].sum().reset_index()
+                # Spend trend over time
+                spend_by_month = _spend_by_month(supplier_spend)
                 
                 fig4 = px.line(
                     spend_by_month,
@@ -421,8 +616,7 @@ def show(session_state):
                 st.plotly_chart(fig4, use_container_width=True, key="spend_trend_chart")
             
             # Spend by business unit
-            spend_by_bu = supplier_spend.groupby("BusinessUnit")["Amount"].sum().reset_index()
-            spend_by_bu = spend_by_bu.sort_values("Amount", ascending=False)
+            spend_by_bu = _spend_by(supplier_spend, "BusinessUnit")
             
             fig5 = px.bar(
                 spend_by_bu,
@@ -649,103 +843,89 @@ def show(session_state):
     # Supplier Segmentation Overview
     st.subheader("Supplier Segmentation Overview")
     
-    # Get all supplier data with performance and spend information
-    latest_quarter = performance_data["Quarter"].max()
-    latest_performance = performance_data[performance_data["Quarter"] == latest_quarter]
-    
-    # Prepare data for segmentation
-    segmentation_data = []
+    # Nothing is built until the user switches the matrix on; the choice persists across reruns
+    if not st.toggle("Show segmentation matrix", value=False, key="show_segmentation_matrix"):
+        return
     
-    for _, supplier in supplier_data.iterrows():
-        # Get performance data
-        perf = latest_performance[latest_performance["SupplierID"] == supplier["SupplierID"]]
-        performance_score = perf["OverallScore"].iloc[0] if len(perf) > 0 else 5.0  # Default if no data
+    # The segmentation frame and its coordinate array don't depend on the selected supplier, so keep
+    # them in session state and rebuild only when one of the underlying data frames is replaced
+    segmentation_sources = (supplier_data, performance_data, spend_data)
+    cached_sources = session_state.get("_segmentation_sources")
+    if cached_sources is None or any(cached is not source for cached, source in zip(cached_sources, segmentation_sources)):
+        # Get all supplier data with performance and spend information
+        latest_quarter = performance_data["Quarter"].max()
+        latest_performance = performance_data[performance_data["Quarter"] == latest_quarter]
         
-        # Get spend data
-        supplier_name = supplier["SupplierName"]
-        spend = spend_data[spend_data["Supplier"] == supplier_name]
-        total_spend = spend["Amount"].sum() if len(spend) > 0 else 0
+        # Prepare data for segmentation as one typed array per column; the plotted coordinates are
+        # float32, which halves the chart payload without losing precision for 0-100 and 1-10 ranges
+        supplier_id_col = supplier_data["SupplierID"]
+        supplier_ids = supplier_id_col.to_numpy()
+        supplier_names = supplier_data["SupplierName"]
         
-        # Calculate spend percentile (higher percentile = higher relative spend)
-        all_suppliers_spend = spend_data.groupby("Supplier")["Amount"].sum()
-        spend_percentile = (all_suppliers_spend <= total_spend).mean() * 100 if total_spend > 0 else 0
+        # Latest performance score per supplier, defaulting when there is no data
+        latest_scores = latest_performance.drop_duplicates("SupplierID").set_index("SupplierID")["OverallScore"]
+        performance_scores = supplier_id_col.map(latest_scores).fillna(5.0).to_numpy(dtype=float)
         
-        # Add to segmentation data
-        segmentation_data.append({
-            "SupplierID": supplier["SupplierID"],
-            "SupplierName": supplier_name,
-            "Category": supplier["Category"],
-            "PerformanceScore": performance_score,
-            "TotalSpend": total_spend,
-            "SpendPercentile": spend_percentile,
-            "IsSelected": supplier["SupplierID"] == selected_supplier_id
-        })
-    
-    segmentation_df = pd.DataFrame(segmentation_data)
-    
-    # Create segmentation quadrant chart
-    fig7 = px.scatter(
-        segmentation_df,
-        x="SpendPercentile",
-        y="PerformanceScore",
-        color="Category",
-        size="TotalSpend",
-        hover_name="SupplierName",
-        title="Supplier Segmentation Matrix",
-        labels={
-            "SpendPercentile": "Spend (Percentile)",
-            "PerformanceScore": "Performance Score (1-10)",
-            "Category": "Category"
-        },
-        size_max=25,
-        opacity=0.7
-    )
+        # Total spend and precomputed spend percentile (higher percentile = higher relative spend)
+        total_spends = supplier_names.map(all_suppliers_spend).fillna(0).to_numpy(dtype=float)
+        percentile_by_supplier = pd.Series(spend_percentiles, index=all_suppliers_spend.index)
+        spend_pcts = np.where(total_spends > 0, supplier_names.map(percentile_by_supplier).to_numpy(dtype=float), 0.0)
+        
+        segmentation_df = pd.DataFrame({
+            "SupplierID": supplier_ids,
+            "SupplierName": supplier_names.to_numpy(),
+            "Category": supplier_data["Category"].to_numpy(),
+            "PerformanceScore": performance_scores.astype(np.float32),
+            "TotalSpend": total_spends,
+            "SpendPercentile": spend_pcts.astype(np.float32),
+            "SpendLabel": _fmt_spend(total_spends)
+        }, copy=False)
+        
+        session_state["_segmentation_df"] = segmentation_df
+        session_state["_segmentation_ids"] = supplier_ids
+        session_state["_segmentation_coords"] = segmentation_df[["SpendPercentile", "PerformanceScore"]].to_numpy()
+        session_state["_segmentation_sources"] = segmentation_sources
     
-    # Apply standardized horizontal legend style at bottom
-    # Position legend at bottom horizontally
-    fig7.update_layout(
-        legend=dict(
-            orientation="h",       # Horizontal legend
-            yanchor="top",         # Anchor from top of legend box
-            y=-0.2,                # Position below the chart
-            xanchor="center",      # Center anchor
-            x=0.5                  # Center position
-        ),
-        margin=dict(l=20, r=20, t=50, b=100),  # Extra bottom margin
-        height=550                 # Taller chart
-    )
+    # Bind the memoized arrays once; the highlight below only does plain NumPy indexing
+    segmentation_df = session_state["_segmentation_df"]
+    segmentation_ids = session_state["_segmentation_ids"]
+    segmentation_coords = session_state["_segmentation_coords"]
     
-    # Highlight the selected supplier
-    selected_supplier_data = segmentation_df[segmentation_df["IsSelected"]]
+    # Create segmentation quadrant chart from only the columns the chart encodes
+    plot_df = segmentation_df[["SpendPercentile", "PerformanceScore", "Category", "TotalSpend", "SupplierName", "SpendLabel"]]
     
-    if len(selected_supplier_data) > 0:
-        x = selected_supplier_data["SpendPercentile"].iloc[0]
-        y = selected_supplier_data["PerformanceScore"].iloc[0]
-        
-        fig7.add_trace(go.Scatter(
-            x=[x],
-            y=[y],
-            mode="markers",
-            marker=dict(
-                size=16,
-                color="rgba(0,0,0,0)",
-                line=dict(
-                    color="black",
-                    width=2
-                )
-            ),
-            showlegend=False,
-            hoverinfo="skip"
-        ))
+    # Reuse the cached base chart; only the selected-supplier overlay changes with the selection
+    fig7 = _segmentation_figure(plot_df)
     
-    # Add quadrant lines
-    fig7.add_hline(y=7.5, line_width=1, line_dash="dash", line_color="gray")
-    fig7.add_vline(x=60, line_width=1, line_dash="dash", line_color="gray")
+    # Quadrant labels collide on narrow phone screens, so leave them out there
+    if _is_mobile_client():
+        fig7["layout"]["annotations"] = []
     
-    # Add quadrant annotations
-    fig7.add_annotation(x=80, y=8.75, text="Strategic", showarrow=False, font=dict(size=12, color="green"))
-    fig7.add_annotation(x=30, y=8.75, text="Potential", showarrow=False, font=dict(size=12, color="blue"))
-    fig7.add_annotation(x=80, y=3.75, text="Problematic", showarrow=False, font=dict(size=12, color="red"))
-    fig7.add_annotation(x=30, y=3.75, text="Transactional", showarrow=False, font=dict(size=12, color="gray"))
+    # Highlight the selected supplier, located by row position instead of a filtered copy of the frame
+    is_selected = segmentation_ids == selected_supplier_id
+    if is_selected.any():
+        selected_idx = is_selected.argmax()
+        x, y = segmentation_coords[selected_idx]
+        
+        # A 16px ring drawn as a layout shape anchored at the point, rather than an extra WebGL trace
+        fig7["layout"]["shapes"].append(dict(
+            type="circle",
+            xref="x",
+            yref="y",
+            xsizemode="pixel",
+            ysizemode="pixel",
+            xanchor=x,
+            yanchor=y,
+            x0=-8,
+            x1=8,
+            y0=-8,
+            y1=8,
+            line=dict(
+                color="black",
+                width=2
+            )
+        ))
     
-    st.plotly_chart(fig7, use_container_width=True)
+    # The cached dict came from a validated figure, so wrap it without re-running Plotly's validators;
+    # Streamlit then serializes the Figure as-is instead of rebuilding and validating it from the dict
+    st.plotly_chart(go.Figure(fig7, _validate=False), use_container_width=True)
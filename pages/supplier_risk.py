@@ -1,34 +1,625 @@
+import operator
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from utils.visualizations import apply_standard_legend_style
 from utils.visualizations import create_supplier_chart
 from utils.llm_analysis import generate_supplier_insights
 
+# Display order of supplier tiers, Tier 1 being the most strategic
+_TIER_ORDER = ["Tier 1", "Tier 2", "Tier 3", "Tier 4", "Tier 5"]
+
+# Performance score columns recognised in performance data, in display order
+_STANDARD_METRICS = ("OverallScore", "DeliveryScore", "QualityScore", "ResponsivenessScore",
+                     "CostScore", "InnovationScore", "SustainabilityScore")
+
+# Simulated public risk indicators and their weight in the overall RiskScore
+_RISK_WEIGHTS = {"FinancialRisk": 0.4, "ESGRisk": 0.3, "ComplianceRisk": 0.2, "GeopoliticalRisk": 0.1}
+
+# Quadrant dividers and labels of the performance vs. risk matrix
+_QUADRANT_SHAPES = [
+    dict(type="line", xref="x domain", x0=0, x1=1, yref="y", y0=7.5, y1=7.5, line=dict(width=1, dash="dash", color="gray")),
+    dict(type="line", xref="x", x0=5, x1=5, yref="y domain", y0=0, y1=1, line=dict(width=1, dash="dash", color="gray"))
+]
+_QUADRANT_ANNOTATIONS = [
+    dict(x=2.5, y=8.75, text="Strategic Partners", showarrow=False, font=dict(size=12, color="green")),
+    dict(x=7.5, y=8.75, text="Performance Concerns", showarrow=False, font=dict(size=12, color="orange")),
+    dict(x=2.5, y=3.75, text="Reliable", showarrow=False, font=dict(size=12, color="blue")),
+    dict(x=7.5, y=3.75, text="High Risk", showarrow=False, font=dict(size=12, color="red"))
+]
+
+# Simulated risk alert rules: (column, comparison, threshold, type, severity, description, recommendation)
+_ALERT_RULES = (
+    ("FinancialRisk", operator.gt, 7, "Financial", "High",
+     "Financial stability concerns detected for {name}.",
+     "Consider requiring financial guarantees or adjusting payment terms."),
+    ("ESGRisk", operator.gt, 7, "ESG", "High",
+     "Environmental or social compliance issues identified for {name}.",
+     "Request ESG compliance documentation and schedule an audit."),
+    ("DeliveryScore", operator.lt, 6, "Performance", "Medium",
+     "Consistent delivery issues with {name}.",
+     "Implement a performance improvement plan with monthly reviews.")
+)
+
+# Low-cardinality text columns used for filtering and grouping on this page
+_ARROW_STRING_COLUMNS = ["Category", "Country", "Region", "RiskCategory", "TierRanking", "PaymentTerms"]
+
+def _with_arrow_strings(data):
+    """Store the filter/group text columns as Arrow-backed strings so == and groupby use Arrow kernels"""
+    object_columns = {col: "string[pyarrow]" for col in _ARROW_STRING_COLUMNS
+                      if col in data.columns and data[col].dtype == object}
+    return data.astype(object_columns) if object_columns else data
+
+@st.cache_data
+def _sorted_unique(values):
+    """Sorted distinct non-null values of a column, for filter options"""
+    return np.unique(values.dropna().to_numpy()).tolist()
+
+# Function to get filtered data based on available columns
+def get_filtered_suppliers(data, filters):
+    # AND the filters into one mask so the frame is only sliced once
+    mask = np.ones(len(data), dtype=bool)
+    for col, value in filters.items():
+        if col in data.columns and value is not None and not (isinstance(value, str) and value.startswith("All ")):
+            mask &= (data[col] == value).to_numpy(dtype=bool, na_value=False)
+    return data.loc[mask]
+
+@st.cache_data
+def _latest_performance(performance_data, time_column):
+    """Keep each supplier's most recent performance row"""
+    # Per supplier rather than the global latest period, so a supplier missing the newest period keeps its scores
+    return performance_data.sort_values(time_column, kind="stable").groupby("SupplierID", sort=False).tail(1)
+
+def _synthesize_tiers(supplier_performance):
+    """
+    Assign a synthetic TierRanking to suppliers whose data carries none.
+    
+    Tiers come from annual revenue percentiles, from a Pareto split of spend,
+    or failing both from an equal three-way split.
+    
+    Returns:
+        tuple: (supplier_performance with TierRanking, message describing the tier basis)
+    """
+    if "AnnualRevenue" in supplier_performance.columns:
+        # Sorting by revenue size
+        supplier_performance = supplier_performance.sort_values("AnnualRevenue", ascending=False)
+        
+        # Create tier groups based on percentiles (top 10% = Tier 1, next 20% = Tier 2, rest = Tier 3)
+        top_10_percent = int(len(supplier_performance) * 0.1)
+        next_20_percent = int(len(supplier_performance) * 0.3)
+        
+        rank = np.arange(len(supplier_performance))
+        supplier_performance["TierRanking"] = np.select(
+            [rank < top_10_percent, rank < next_20_percent], ["Tier 1", "Tier 2"], default="Tier 3"
+        )
+        
+        tier_message = "Tiers calculated based on Annual Revenue"
+    elif "Amount" in supplier_performance.columns or any(col for col in supplier_performance.columns if "Spend" in col):
+        # Find the spend column
+        spend_col = "Amount" if "Amount" in supplier_performance.columns else next(col for col in supplier_performance.columns if "Spend" in col)
+        
+        # Sum spend per supplier and rank suppliers from largest to smallest
+        spend_by_supplier = supplier_performance.groupby("SupplierID", sort=False)[spend_col].sum()
+        spend = spend_by_supplier.to_numpy()
+        order = np.argsort(-spend, kind="stable")
+        
+        # Create tier groups based on Pareto principle (80/20 rule)
+        spend_percentage = np.cumsum(spend[order]) / spend.sum()
+        
+        # Tier 1: Top suppliers accounting for 80% of spend
+        # Tier 2: Next group accounting for 15% of spend
+        # Tier 3: Remaining suppliers accounting for 5% of spend
+        tiers = np.select([spend_percentage <= 0.8, spend_percentage <= 0.95], ["Tier 1", "Tier 2"], default="Tier 3")
+        
+        # Map tiers back onto the main dataset by supplier ID
+        tier_lookup = pd.Series(tiers, index=spend_by_supplier.index[order])
+        supplier_performance["TierRanking"] = supplier_performance["SupplierID"].map(tier_lookup)
+        
+        tier_message = "Tiers calculated based on Spend (Pareto principle: Tier 1 = 80% of spend, Tier 2 = next 15%, Tier 3 = remaining 5%)"
+    else:
+        # If no financial data, create equal tiers
+        third = len(supplier_performance) // 3
+        rank = np.arange(len(supplier_performance))
+        supplier_performance["TierRanking"] = np.select(
+            [rank < third, rank < 2*third], ["Tier 1", "Tier 2"], default="Tier 3"
+        )
+        
+        tier_message = "Tiers calculated based on equal distribution (no financial data available)"
+    
+    return supplier_performance, tier_message
+
+@st.cache_data
+def _build_supplier_performance(supplier_data, performance_data, filters, score_range):
+    """
+    Filter suppliers, join their latest performance scores and assign tiers.
+    
+    Parameters:
+        supplier_data (pd.DataFrame): Supplier master data
+        performance_data (pd.DataFrame): Supplier performance history
+        filters (dict): Column -> selected value, None meaning no filter
+        score_range (tuple): (min, max) OverallScore to keep, or None
+        
+    Returns:
+        tuple: (filtered_suppliers, supplier_performance, perf_metrics, tier_message);
+        tier_message is None when the data already carries a TierRanking
+    """
+    # Apply filters to supplier data
+    filtered_suppliers = get_filtered_suppliers(supplier_data, filters)
+    
+    # Check if we have performance data available
+    if not performance_data.empty and "SupplierID" in performance_data.columns:
+        # Determine the time/date column for performance data
+        time_column = None
+        for col_name in ["Quarter", "EvaluationDate", "Date", "Period"]:
+            if col_name in performance_data.columns:
+                time_column = col_name
+                break
+        
+        if time_column:
+            # Get each supplier's latest performance scores
+            latest_performance = _latest_performance(performance_data, time_column)
+        else:
+            # If no time column, use all performance data
+            latest_performance = performance_data
+            
+        # Determine available performance metrics
+        available_columns = set(performance_data.columns)
+        perf_metrics = [metric for metric in _STANDARD_METRICS if metric in available_columns]
+        
+        if not perf_metrics:
+            # If no standard metrics found, look for any numeric columns
+            perf_metrics = performance_data.select_dtypes(include=["number", "bool"]).columns.drop("SupplierID", errors="ignore").tolist()
+        
+        # For merging, select only available columns
+        merge_columns = ["SupplierID"] + perf_metrics
+        available_merge_columns = [col for col in merge_columns if col in latest_performance.columns]
+        
+        # Merge supplier and performance data
+        supplier_performance = filtered_suppliers.merge(
+            latest_performance[available_merge_columns],
+            on="SupplierID",
+            how="left"
+        )
+        
+        # Apply performance score filter if it exists
+        if score_range is not None and "OverallScore" in supplier_performance.columns:
+            min_score, max_score = score_range
+            supplier_performance = supplier_performance[
+                (supplier_performance["OverallScore"] >= min_score) &
+                (supplier_performance["OverallScore"] <= max_score)
+            ]
+    else:
+        # If no performance data, just use supplier data
+        supplier_performance = filtered_suppliers.copy()
+        perf_metrics = []
+    
+    # If tier data is not available, create a synthetic tier based on spend or revenue
+    tier_message = None
+    if len(supplier_performance) > 0 and "TierRanking" not in supplier_performance.columns:
+        supplier_performance, tier_message = _synthesize_tiers(supplier_performance)
+    
+    # Store group keys as categoricals so the groupbys in show() hash small integer codes
+    if "TierRanking" in supplier_performance.columns:
+        tiers = supplier_performance["TierRanking"]
+        if tiers.isin(_TIER_ORDER).all():
+            supplier_performance["TierRanking"] = pd.Categorical(tiers, categories=_TIER_ORDER, ordered=True)
+        else:
+            supplier_performance["TierRanking"] = tiers.astype("category")
+    for col in ["RiskCategory", "PaymentTerms"]:
+        if col in supplier_performance.columns:
+            supplier_performance[col] = supplier_performance[col].astype("category")
+    
+    return filtered_suppliers, supplier_performance, perf_metrics, tier_message
+
+# Supplier columns read by the risk matrix, top-risk chart and detailed risk profile
+_RISK_COLUMNS = ["SupplierID", "SupplierName", "Category", "OverallScore", "DeliveryScore", "AnnualRevenue"]
+
+@st.cache_data
+def _simulate_risk_indicators(supplier_performance):
+    """Add simulated public risk indicators and a weighted RiskScore to each supplier, sorted by RiskScore descending"""
+    # Seeded so a cached result matches what a fresh run would produce
+    rng = np.random.default_rng(42)
+    risks = rng.uniform(1.0, 10.0, size=(len(supplier_performance), len(_RISK_WEIGHTS)))
+    
+    # Only the columns the risk charts and profile read, copied so the risk columns can be written into it
+    supplier_performance = supplier_performance.loc[:, supplier_performance.columns.intersection(_RISK_COLUMNS, sort=False)].copy()
+    supplier_performance[list(_RISK_WEIGHTS)] = risks
+    
+    # Create a risk score (lower is better for risk scores)
+    supplier_performance["RiskScore"] = risks @ np.fromiter(_RISK_WEIGHTS.values(), dtype=risks.dtype)
+    
+    # Highest risk first, so the top-10 chart is a head() and the profile selector lists riskiest suppliers first
+    return supplier_performance.sort_values("RiskScore", ascending=False, kind="stable")
+
+# Bar colors per tier, Tier 1 being the darkest
+_TIER_COLORS = ["#FF6B35", "#FF8C61", "#FFAC8C", "#FFCDB8", "#FFE6DD"]
+
+@st.cache_data
+def _tier_count_figure(tier_counts):
+    """Build the suppliers-by-tier bar chart from tier -> count as a plain dict"""
+    # A dict copies out of the cache far cheaper than a Figure, which revalidates on unpickling
+    tiers = tier_counts.index.astype(str)
+    fig = px.bar(
+        x=tiers,
+        y=tier_counts.to_numpy(),
+        title="Suppliers by Tier",
+        color=tiers,
+        color_discrete_map=dict(zip(_TIER_ORDER, _TIER_COLORS)),
+        text=tier_counts.to_numpy(),
+        labels={"x": "Tier", "y": "Count", "color": "Tier"}
+    )
+    
+    fig.update_traces(textposition="outside")
+    return fig.to_dict()
+
+@st.cache_data
+def _trend_figure(history_long, time_dimension, supplier_name):
+    """Build one supplier's performance trend chart as a plain dict"""
+    fig5 = px.line(
+        history_long,
+        x=time_dimension,
+        y="Score",
+        color="Metric",
+        title=f"Performance Trend for {supplier_name}",
+        labels={"Score": "Performance Score", time_dimension: time_dimension, "Metric": "Metric"},
+        markers=True
+    )
+    
+    # Auto-scale y-axis based on data range, with some padding
+    max_score = history_long["Score"].max()
+    min_score = history_long["Score"].min()
+    y_range = [max(0, min_score - 0.5), min(10.5, max_score + 0.5)]
+    
+    fig5.update_layout(
+        yaxis=dict(range=y_range),
+        hovermode="x unified"
+    )
+    return fig5.to_dict()
+
+@st.cache_data
+def _supplier_options(supplier_performance):
+    """Selector options for the trend chart: supplier IDs and an ID -> name lookup for their labels"""
+    supplier_ids = supplier_performance["SupplierID"].to_numpy().tolist()
+    # Look option labels up in a dict instead of scanning the frame once per option
+    if "SupplierName" in supplier_performance.columns:
+        id_to_name = dict(zip(supplier_ids, supplier_performance["SupplierName"].to_numpy().tolist()))
+    else:
+        id_to_name = {}
+    return supplier_ids, id_to_name
+
+@st.cache_data
+def _supplier_rows(supplier_performance):
+    """Map each SupplierID to its first row as a dict, for O(1) lookups of the selected supplier"""
+    return supplier_performance.drop_duplicates("SupplierID").set_index("SupplierID", drop=False).to_dict("index")
+
+@st.cache_data
+def _risk_matrix_figure(supplier_performance):
+    """Build the supplier performance vs. risk quadrant scatter as a plain dict"""
+    # Assembled directly as dicts rather than through px, which validates every property of every trace;
+    # one WebGL trace per category, coloured from the active template like px would
+    colorway = pio.templates[pio.templates.default].layout.colorway or px.colors.qualitative.Plotly
+    
+    # Marker diameters in pixels, precomputed once with the same area scaling px uses (largest supplier at 20px)
+    revenue = supplier_performance["AnnualRevenue"].to_numpy(dtype=np.float64)
+    marker_size = np.sqrt(revenue / (np.nanmax(revenue) or 1)) * 20
+    
+    # Pull every column out as an array once; each category trace is then a row selection on these
+    risk_score = supplier_performance["RiskScore"].to_numpy()
+    overall_score = supplier_performance["OverallScore"].to_numpy()
+    supplier_names = supplier_performance["SupplierName"].to_numpy()
+    customdata = supplier_performance[["SupplierID", "SupplierName", "AnnualRevenue"]].to_numpy()
+    
+    traces = []
+    for i, (category, rows) in enumerate(supplier_performance.groupby("Category", sort=False).indices.items()):
+        traces.append({
+            "type": "scattergl",
+            "mode": "markers",
+            "name": category,
+            "legendgroup": category,
+            "x": risk_score[rows],
+            "y": overall_score[rows],
+            "hovertext": supplier_names[rows],
+            "customdata": customdata[rows],
+            "hovertemplate": (
+                "<b>%{hovertext}</b><br><br>Category=" + str(category) +
+                "<br>Risk Score (Lower is Better)=%{x}<br>Performance Score (Higher is Better)=%{y}"
+                "<br>AnnualRevenue=%{customdata[2]}<extra></extra>"
+            ),
+            "marker": {
+                "color": colorway[i % len(colorway)],
+                "size": marker_size[rows],
+                "line": {"width": 0}  # No per-point outline stroke
+            }
+        })
+    
+    layout = {
+        "title": {"text": "Supplier Performance vs. Risk Matrix"},
+        "xaxis": {"title": {"text": "Risk Score (Lower is Better)"}},
+        "yaxis": {"title": {"text": "Performance Score (Higher is Better)"}},
+        # Directly position legend at bottom with clear settings
+        "legend": {
+            "title": {"text": "Category"},
+            "itemsizing": "constant",
+            "tracegroupgap": 0,
+            "orientation": "h",    # Horizontal legend
+            "yanchor": "top",      # Anchor from top of legend box
+            "y": -0.3,             # Position well below the chart
+            "xanchor": "center",   # Center anchor
+            "x": 0.5               # Center position
+        },
+        "margin": {"l": 20, "r": 20, "t": 50, "b": 100},  # Extra bottom margin
+        "height": 550,             # Taller chart
+        "shapes": _QUADRANT_SHAPES,
+        "annotations": _QUADRANT_ANNOTATIONS
+    }
+    return {"data": traces, "layout": layout}
+
+@st.cache_data
+def _top_risk_figure(supplier_performance):
+    """Build the top 10 suppliers by risk score bar chart as a plain dict; expects rows sorted by RiskScore descending"""
+    high_risk_suppliers = supplier_performance[["SupplierName", "RiskScore"]].head(10)
+    risk_scores = high_risk_suppliers["RiskScore"].to_numpy()
+    
+    bar = {
+        "type": "bar",
+        "orientation": "h",
+        "x": risk_scores,
+        "y": high_risk_suppliers["SupplierName"].to_numpy(),
+        "marker": {"color": risk_scores, "coloraxis": "coloraxis"},
+        "hovertemplate": "Risk Score=%{marker.color}<br>Supplier=%{y}<extra></extra>",
+        "showlegend": False
+    }
+    layout = {
+        "title": {"text": "Top 10 Suppliers by Risk Score"},
+        "xaxis": {"title": {"text": "Risk Score"}},
+        "yaxis": {"title": {"text": "Supplier"}, "categoryorder": "total ascending"},
+        "coloraxis": {
+            "colorscale": px.colors.sequential.Oranges_r,  # Reversed scale since higher risk is worse
+            "colorbar": {"title": {"text": "Risk Score"}}
+        },
+        "barmode": "relative"
+    }
+    return {"data": [bar], "layout": layout}
+
+@st.cache_data
+def _risk_radar_figure(risk_values, supplier_name):
+    """Build one supplier's risk dimension radar chart as a plain dict"""
+    # Fixed, known-good schema, so skip Plotly's property validation
+    fig8 = go.Figure(_validate=False)
+    
+    fig8.add_trace(go.Scatterpolar(
+        r=risk_values,
+        theta=["Financial", "ESG", "Compliance", "Geopolitical"],
+        fill='toself',
+        name='Risk Profile',
+        line_color='orange',
+        _validate=False
+    ))
+    
+    fig8.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 10]
+            )),
+        showlegend=False,
+        title={"text": f"Risk Profile for {supplier_name}"}
+    )
+    return fig8.to_dict()
+
+@st.cache_data
+def _risk_gauge_figure(risk_score):
+    """Build the overall risk score gauge as a plain dict"""
+    # Fixed, known-good schema, so skip Plotly's property validation
+    fig9 = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=risk_score,
+        title={"text": "Overall Risk Score"},
+        gauge={
+            'axis': {'range': [0, 10], 'tickwidth': 1},
+            'bar': {'color': "orange"},
+            'steps': [
+                {'range': [0, 3.33], 'color': "green"},
+                {'range': [3.33, 6.66], 'color': "yellow"},
+                {'range': [6.66, 10], 'color': "red"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': risk_score
+            }
+        },
+        _validate=False
+    ), _validate=False)
+    return fig9.to_dict()
+
+@st.cache_data
+def _risk_alerts(supplier_name, financial_risk, esg_risk, delivery_score):
+    """Render the simulated risk alerts for one supplier as markdown strings"""
+    values = {"FinancialRisk": financial_risk, "ESGRisk": esg_risk, "DeliveryScore": delivery_score}
+    alerts = []
+    
+    for column, compare, threshold, alert_type, severity, description, recommendation in _ALERT_RULES:
+        if compare(values[column], threshold):
+            alerts.append({
+                "type": alert_type,
+                "severity": severity,
+                "description": description.format(name=supplier_name),
+                "recommendation": recommendation
+            })
+    
+    return [
+        f"**{alert['type']} Risk - {alert['severity']} Severity**\n\n"
+        f"{alert['description']}\n\n"
+        f"**Recommendation:** {alert['recommendation']}"
+        for alert in alerts
+    ]
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_supplier_insights(supplier_id, supplier_data, performance_data, spend_data, llm_provider):
+    """LLM risk insights for one supplier; llm_provider only keys the cache so switching providers asks again"""
+    return generate_supplier_insights(supplier_id, supplier_data, performance_data, spend_data, use_llm=True)
+
+@st.fragment
+def _trend_section(performance_data, supplier_performance):
+    """Supplier selector and performance trend chart; reruns on its own when the selection changes"""
+    # Check if we have performance data and it's not empty
+    if not performance_data.empty and len(supplier_performance) > 0 and "SupplierID" in supplier_performance.columns:
+        # Supplier selector for trend analysis
+        try:
+            supplier_ids, id_to_name = _supplier_options(supplier_performance)
+            
+            selected_supplier_id = st.selectbox(
+                "Select Supplier for Trend Analysis:",
+                options=supplier_ids,
+                format_func=lambda x: id_to_name.get(x, x)
+            )
+            
+            # Get performance history for selected supplier
+            supplier_history = performance_data[performance_data["SupplierID"] == selected_supplier_id]
+            
+            # Determine time dimension column
+            time_dimension = None
+            for col in ["Quarter", "EvaluationDate", "Date", "Period"]:
+                if col in supplier_history.columns:
+                    time_dimension = col
+                    break
+            
+            if len(supplier_history) > 0 and time_dimension is not None:
+                # Determine available metrics
+                available_columns = set(supplier_history.columns)
+                available_metrics = [metric for metric in _STANDARD_METRICS if metric in available_columns]
+                
+                if available_metrics:
+                    # Create a more readable label for the metrics
+                    metric_labels = {}
+                    for metric in available_metrics:
+                        # Convert camelCase to Space Separated Text
+                        label = metric.replace("Score", "").replace("_", " ").title()
+                        metric_labels[metric] = label
+                    
+                    # Melt the metric columns into a long format dataframe for the line chart;
+                    # the labels are applied to the column names rather than to every melted row
+                    history_long = (
+                        supplier_history[["SupplierID", time_dimension, *available_metrics]]
+                        .rename(columns=metric_labels)
+                        .melt(id_vars=["SupplierID", time_dimension], var_name="Metric", value_name="Score")
+                    )
+                    
+                    # Get supplier name for title
+                    if selected_supplier_id in id_to_name:
+                        supplier_name = id_to_name[selected_supplier_id]
+                    else:
+                        supplier_name = f"Supplier {selected_supplier_id}"
+                    
+                    # Create the trend chart
+                    fig5 = _trend_figure(history_long, time_dimension, supplier_name)
+                    st.plotly_chart(go.Figure(fig5, _validate=False), use_container_width=True, key="risk_trend_chart")
+                else:
+                    st.info("No performance metrics available for trend analysis")
+            else:
+                st.info(f"No performance history available for this supplier")
+        except Exception as e:
+            st.error(f"Error creating performance trend chart: {str(e)}")
+    else:
+        st.info("Performance data is required for trend analysis. Please upload supplier performance data.")
+
+@st.fragment
+def _detailed_risk_profile(sid_to_row, supplier_data, performance_data, spend_data, llm_provider):
+    """Risk radar, gauge, alerts and AI analysis for one selected supplier; reruns on its own when the selection changes"""
+    selected_supplier_id_risk = st.selectbox(
+        "Select Supplier for Detailed Risk Analysis:",
+        options=list(sid_to_row),
+        format_func=lambda x: sid_to_row[x]["SupplierName"],
+        key="risk_supplier_selector"
+    )
+    
+    # Get the selected supplier data
+    selected_supplier = sid_to_row[selected_supplier_id_risk]
+    supplier_name, financial_risk, esg_risk, compliance_risk, geopolitical_risk, delivery_score, risk_score = (
+        selected_supplier[field] for field in (
+            "SupplierName", "FinancialRisk", "ESGRisk", "ComplianceRisk", "GeopoliticalRisk", "DeliveryScore", "RiskScore"
+        )
+    )
+    
+    # Create columns for risk profile
+    profile_col1, profile_col2 = st.columns(2)
+    
+    with profile_col1:
+        # Create a radar chart for risk dimensions
+        risk_values = np.array([financial_risk, esg_risk, compliance_risk, geopolitical_risk], dtype=np.float64)
+        
+        fig8 = _risk_radar_figure(risk_values, supplier_name)
+        st.plotly_chart(go.Figure(fig8, _validate=False), use_container_width=True, key="risk_radar_chart")
+    
+    with profile_col2:
+        # Create a gauge chart for overall risk
+        fig9 = _risk_gauge_figure(risk_score)
+        st.plotly_chart(go.Figure(fig9, _validate=False), use_container_width=True, key="risk_gauge_chart")
+    
+    # Risk alerts and recommendations
+    st.subheader("Risk Alerts & Recommendations")
+    
+    # Simulated risk alerts based on the selected supplier
+    alerts = _risk_alerts(supplier_name, financial_risk, esg_risk, delivery_score)
+    
+    if len(alerts) == 0:
+        st.success(f"No significant risk alerts for {supplier_name}.")
+    else:
+        for alert in alerts:
+            st.warning(alert)
+    
+    # AI-Powered Supplier Risk Analysis
+    st.subheader("AI-Powered Supplier Risk Analysis")
+    
+    # Check if LLM is configured
+    if llm_provider == "None":
+        st.info("Enable AI model configuration in the sidebar to get enhanced supplier risk analysis")
+        return
+    
+    # The LLM only runs on request; results are kept per provider and supplier for the session
+    insights_key = f"risk_insights_{llm_provider}_{selected_supplier_id_risk}"
+    if st.button("Run AI Risk Analysis", key="run_llm_risk") and insights_key not in st.session_state:
+        with st.spinner("Generating advanced risk insights..."):
+            # Get the supplier insights using LLM
+            st.session_state[insights_key] = _cached_supplier_insights(
+                selected_supplier_id_risk, 
+                supplier_data, 
+                performance_data, 
+                spend_data, 
+                llm_provider
+            )
+    
+    if insights_key in st.session_state:
+        # Display the AI-generated insights
+        st.markdown(st.session_state[insights_key])
+        
+        # Ask user if they want to generate a risk mitigation plan
+        if st.button("Generate Risk Mitigation Plan", key="gen_risk_plan"):
+            with st.spinner("Generating comprehensive risk mitigation plan..."):
+                # This would call an additional LLM function to generate a risk plan
+                st.success("Risk mitigation plan functionality will be implemented in the next update")
+                st.info("This feature would generate a detailed risk mitigation plan using AI analysis of the supplier's risk profile")
+
 def show(session_state):
     """Display the Supplier Risk Analysis tab content"""
     st.title("🔍 Supplier Risk Analysis")
     
     # Get data from session state
-    supplier_data = session_state.supplier_data
+    supplier_data = _with_arrow_strings(session_state.supplier_data)
     performance_data = session_state.performance_data
     spend_data = session_state.spend_data
+    # Changing the provider in the sidebar reruns the whole page, so one read serves the fragments too
+    llm_provider = session_state.get("llm_provider", "None")
     
     # Filter controls
     st.subheader("Filter Suppliers")
     
     col1, col2, col3 = st.columns(3)
     
-    # Function to get filtered data based on available columns
-    def get_filtered_suppliers(data, filters):
-        filtered = data.copy()
-        for col, value in filters.items():
-            if col in data.columns and value is not None and not (isinstance(value, str) and value.startswith("All ")):
-                filtered = filtered[filtered[col] == value]
-        return filtered
-    
     filters = {}
     selected_category = None
     selected_country = None
@@ -36,7 +627,7 @@ def show(session_state):
     with col1:
         # Dynamic Category filter based on available data
         if "Category" in supplier_data.columns:
-            categories = ["All Categories"] + sorted(supplier_data["Category"].unique().tolist())
+            categories = ["All Categories"] + _sorted_unique(supplier_data["Category"])
             selected_category = st.selectbox("Select Category:", categories, key="risk_category")
             filters["Category"] = selected_category if selected_category != "All Categories" else None
         else:
@@ -45,11 +636,11 @@ def show(session_state):
     with col2:
         # Dynamic Country/Region filter based on available data
         if "Country" in supplier_data.columns:
-            countries = ["All Countries"] + sorted(supplier_data["Country"].unique().tolist())
+            countries = ["All Countries"] + _sorted_unique(supplier_data["Country"])
             selected_country = st.selectbox("Select Country:", countries)
             filters["Country"] = selected_country if selected_country != "All Countries" else None
         elif "Region" in supplier_data.columns:
-            regions = ["All Regions"] + sorted(supplier_data["Region"].unique().tolist())
+            regions = ["All Regions"] + _sorted_unique(supplier_data["Region"])
             selected_region = st.selectbox("Select Region:", regions)
             filters["Region"] = selected_region if selected_region != "All Regions" else None
         else:
@@ -81,61 +672,10 @@ def show(session_state):
             st.info("Performance score data not available")
             score_range = None
     
-    # Apply filters to supplier data
-    filtered_suppliers = get_filtered_suppliers(supplier_data, filters)
-    
-    # Check if we have performance data available
-    if not performance_data.empty and "SupplierID" in performance_data.columns:
-        # Determine the time/date column for performance data
-        time_column = None
-        for col_name in ["Quarter", "EvaluationDate", "Date", "Period"]:
-            if col_name in performance_data.columns:
-                time_column = col_name
-                break
-        
-        if time_column:
-            # Get latest performance scores
-            latest_period = performance_data[time_column].max()
-            latest_performance = performance_data[performance_data[time_column] == latest_period]
-        else:
-            # If no time column, use all performance data
-            latest_performance = performance_data
-            
-        # Determine available performance metrics
-        perf_metrics = []
-        for metric in ["OverallScore", "DeliveryScore", "QualityScore", "ResponsivenessScore", 
-                      "CostScore", "InnovationScore", "SustainabilityScore"]:
-            if metric in performance_data.columns:
-                perf_metrics.append(metric)
-        
-        if not perf_metrics:
-            # If no standard metrics found, look for any numeric columns
-            for col in performance_data.columns:
-                if col != "SupplierID" and pd.api.types.is_numeric_dtype(performance_data[col]):
-                    perf_metrics.append(col)
-        
-        # For merging, select only available columns
-        merge_columns = ["SupplierID"] + perf_metrics
-        available_merge_columns = [col for col in merge_columns if col in latest_performance.columns]
-        
-        # Merge supplier and performance data
-        supplier_performance = filtered_suppliers.merge(
-            latest_performance[available_merge_columns],
-            on="SupplierID",
-            how="left"
-        )
-        
-        # Apply performance score filter if it exists
-        if score_range is not None and "OverallScore" in supplier_performance.columns:
-            min_score, max_score = score_range
-            supplier_performance = supplier_performance[
-                (supplier_performance["OverallScore"] >= min_score) &
-                (supplier_performance["OverallScore"] <= max_score)
-            ]
-    else:
-        # If no performance data, just use supplier data
-        supplier_performance = filtered_suppliers.copy()
-        perf_metrics = []
+    # Filtering, the performance merge and tier synthesis are cached, so reruns from unrelated widgets skip them
+    filtered_suppliers, supplier_performance, perf_metrics, tier_message = _build_supplier_performance(
+        supplier_data, performance_data, filters, score_range
+    )
     
     # Main content area
     if len(supplier_performance) == 0:
@@ -144,193 +684,108 @@ def show(session_state):
         # Tiered Supplier Analysis
         st.subheader("Tiered Supplier Analysis")
         
-        # Determine if we have tier ranking data
-        has_tier_data = "TierRanking" in supplier_performance.columns
-        
-        # If tier data is not available, create a synthetic tier based on spend or revenue
-        if not has_tier_data:
-            if "AnnualRevenue" in supplier_performance.columns:
-                # Sorting by revenue size
-                supplier_performance = supplier_performance.sort_values("AnnualRevenue", ascending=False)
-                
-                # Create tier groups based on percentiles (top 10% = Tier 1, next 20% = Tier 2, rest = Tier 3)
-                top_10_percent = int(len(supplier_performance) * 0.1)
-                next_20_percent = int(len(supplier_performance) * 0.3)
-                
-                supplier_performance["TierRanking"] = "Tier 3"
-                supplier_performance.iloc[:top_10_percent, supplier_performance.columns.get_loc("TierRanking")] = "Tier 1"
-                supplier_performance.iloc[top_10_percent:next_20_percent, supplier_performance.columns.get_loc("TierRanking")] = "Tier 2"
-                
-                tier_message = "Tiers calculated based on Annual Revenue"
-            elif "Amount" in supplier_performance.columns or any(col for col in supplier_performance.columns if "Spend" in col):
-                # Find the spend column
-                spend_col = "Amount" if "Amount" in supplier_performance.columns else next(col for col in supplier_performance.columns if "Spend" in col)
-                
-                # Group by supplier ID and sum spend
-                spend_by_supplier = supplier_performance.groupby("SupplierID")[spend_col].sum().reset_index()
-                spend_by_supplier = spend_by_supplier.sort_values(spend_col, ascending=False)
-                
-                # Create tier groups based on Pareto principle (80/20 rule)
-                total_spend = spend_by_supplier[spend_col].sum()
-                cumulative_spend = spend_by_supplier[spend_col].cumsum()
-                spend_percentage = cumulative_spend / total_spend
-                
-                # Tier 1: Top suppliers accounting for 80% of spend
-                # Tier 2: Next group accounting for 15% of spend
-                # Tier 3: Remaining suppliers accounting for 5% of spend
-                spend_by_supplier["TierRanking"] = "Tier 3"
-                spend_by_supplier.loc[spend_percentage <= 0.8, "TierRanking"] = "Tier 1"
-                spend_by_supplier.loc[(spend_percentage > 0.8) & (spend_percentage <= 0.95), "TierRanking"] = "Tier 2"
-                
-                # Merge back to the main dataset
-                supplier_performance = supplier_performance.merge(
-                    spend_by_supplier[["SupplierID", "TierRanking"]],
-                    on="SupplierID",
-                    how="left"
-                )
-                
-                tier_message = "Tiers calculated based on Spend (Pareto principle: Tier 1 = 80% of spend, Tier 2 = next 15%, Tier 3 = remaining 5%)"
-            else:
-                # If no financial data, create equal tiers
-                supplier_performance["TierRanking"] = "Tier 3"
-                third = len(supplier_performance) // 3
-                supplier_performance.iloc[:third, supplier_performance.columns.get_loc("TierRanking")] = "Tier 1"
-                supplier_performance.iloc[third:2*third, supplier_performance.columns.get_loc("TierRanking")] = "Tier 2"
-                
-                tier_message = "Tiers calculated based on equal distribution (no financial data available)"
-            
+        # TierRanking is always present here; _build_supplier_performance synthesizes it when missing
+        if tier_message:
             st.info(tier_message)
-            has_tier_data = True
         
         # Create tier summary statistics
-        if has_tier_data:
-            tier_summary = supplier_performance.groupby("TierRanking").agg({
-                "SupplierID": "count"
-            }).reset_index()
-            
-            tier_summary = tier_summary.rename(columns={"SupplierID": "Count"})
-            
-            # Add risk metrics if available
-            if "RiskCategory" in supplier_performance.columns:
-                risk_by_tier = supplier_performance.groupby(["TierRanking", "RiskCategory"]).size().unstack(fill_value=0)
-                
-                # Calculate risk percentages
-                for risk_category in risk_by_tier.columns:
-                    tier_summary[f"{risk_category} Risk %"] = 0
-                    
-                for idx, tier in tier_summary.iterrows():
-                    if tier["TierRanking"] in risk_by_tier.index:
-                        total = risk_by_tier.loc[tier["TierRanking"]].sum()
-                        for risk_category in risk_by_tier.columns:
-                            tier_summary.at[idx, f"{risk_category} Risk %"] = round((risk_by_tier.loc[tier["TierRanking"], risk_category] / total) * 100)
-            
-            # Add performance metrics if available
-            for metric in perf_metrics:
-                if metric in supplier_performance.columns:
-                    metric_by_tier = supplier_performance.groupby("TierRanking")[metric].mean()
-                    
-                    for idx, tier in tier_summary.iterrows():
-                        if tier["TierRanking"] in metric_by_tier.index:
-                            tier_summary.at[idx, f"Avg {metric}"] = round(metric_by_tier[tier["TierRanking"]], 2)
-            
-            # Display tier summary
-            col1, col2 = st.columns([2, 3])
+        tier_summary = supplier_performance.groupby("TierRanking", observed=True).size().reset_index(name="Count")
+        
+        # Add risk metrics if available
+        if "RiskCategory" in supplier_performance.columns:
+            risk_by_tier = supplier_performance.groupby(["TierRanking", "RiskCategory"], observed=True).size().unstack(fill_value=0)
             
-            with col1:
-                st.write("Supplier Tier Summary")
-                st.dataframe(tier_summary, use_container_width=True)
+            # Calculate risk percentages per tier and join them on as "<category> Risk %" columns
+            risk_pct = risk_by_tier.div(risk_by_tier.sum(axis=1), axis=0).mul(100).round().add_suffix(" Risk %")
+            tier_summary = tier_summary.merge(risk_pct, left_on="TierRanking", right_index=True, how="left")
+            tier_summary[risk_pct.columns] = tier_summary[risk_pct.columns].fillna(0).astype(int)
+        
+        # Add performance metrics if available
+        tier_metrics = [metric for metric in perf_metrics if metric in supplier_performance.columns]
+        if tier_metrics:
+            perf_by_tier = supplier_performance.groupby("TierRanking", observed=True)[tier_metrics].mean().round(2).add_prefix("Avg ")
+            tier_summary = tier_summary.merge(perf_by_tier, left_on="TierRanking", right_index=True, how="left")
+        
+        # Display tier summary
+        col1, col2 = st.columns([2, 3])
+        
+        with col1:
+            st.write("Supplier Tier Summary")
+            st.dataframe(tier_summary, use_container_width=True)
+        
+        with col2:
+            # Create tiered supplier distribution chart
+            # TierRanking is categorical, so unsorted counts already come out in tier order
+            tier_counts = supplier_performance["TierRanking"].value_counts(sort=False)
+            tier_counts = tier_counts[tier_counts > 0]
             
-            with col2:
-                # Create tiered supplier distribution chart
-                tier_counts = supplier_performance["TierRanking"].value_counts().reset_index()
-                tier_counts.columns = ["Tier", "Count"]
-                
-                # Sort tiers in correct order
-                tier_order = ["Tier 1", "Tier 2", "Tier 3", "Tier 4", "Tier 5"]
-                tier_counts["Tier"] = pd.Categorical(tier_counts["Tier"], categories=tier_order, ordered=True)
-                tier_counts = tier_counts.sort_values("Tier")
-                
-                # Create colors based on tier (Tier 1 = darkest)
-                colors = ["#FF6B35", "#FF8C61", "#FFAC8C", "#FFCDB8", "#FFE6DD"]
-                
-                fig = px.bar(
-                    tier_counts,
-                    x="Tier",
-                    y="Count",
-                    title="Suppliers by Tier",
-                    color="Tier",
-                    color_discrete_map={tier: color for tier, color in zip(tier_order, colors)},
-                    text="Count"
-                )
-                
-                fig.update_traces(textposition="outside")
-                st.plotly_chart(fig, use_container_width=True)
+            fig = _tier_count_figure(tier_counts)
+            st.plotly_chart(go.Figure(fig, _validate=False), use_container_width=True, key="risk_tier_count_chart")
         
         # Risk Visualization by Tier
         st.subheader("Risk Profile by Supplier Tier")
         
-        if has_tier_data:
-            # Risk Matrix by Tier
-            if "RiskCategory" in supplier_performance.columns and "RiskScore" in supplier_performance.columns:
-                # Tier-based risk matrix
-                st.write("Risk Distribution by Tier")
-                
-                tier_risk_fig = px.scatter(
-                    supplier_performance,
-                    x="RiskScore",
-                    y="TierRanking",
-                    color="RiskCategory",
-                    size="RiskScore",
-                    hover_name="SupplierName",
-                    title="Risk Profile by Supplier Tier",
-                    color_discrete_sequence=px.colors.qualitative.Set1,
-                    labels={"RiskScore": "Risk Score (Higher = More Risk)", "TierRanking": "Supplier Tier", "RiskCategory": "Risk Category"}
-                )
-                
-                # Position the legend directly below the chart with simple formatting
-                tier_risk_fig.update_layout(
-                    height=500,  # Taller chart
-                    legend=dict(
-                        orientation="h",         # Horizontal orientation
-                        y=-0.4,                  # More space below
-                        x=0.5,                   # Centered
-                        xanchor="center",
-                        yanchor="top",
-                        font=dict(size=9)        # Smaller font
-                    ),
-                    margin=dict(b=150)           # Much more bottom margin
-                )
-                
-                st.plotly_chart(tier_risk_fig, use_container_width=True)
-            elif any(metric in supplier_performance.columns for metric in perf_metrics):
-                # If we have performance metrics but no risk scores, show performance by tier
-                available_metric = next(metric for metric in perf_metrics if metric in supplier_performance.columns)
-                
-                tier_perf_fig = px.box(
-                    supplier_performance,
-                    x="TierRanking",
-                    y=available_metric,
-                    color="TierRanking",
-                    title=f"Performance Distribution by Tier ({available_metric})",
-                    labels={"TierRanking": "Supplier Tier"}
-                )
-                
-                # Position the legend directly below the chart with simple formatting
-                tier_perf_fig.update_layout(
-                    height=500,  # Taller chart
-                    legend=dict(
-                        orientation="h",         # Horizontal orientation
-                        y=-0.4,                  # More space below
-                        x=0.5,                   # Centered
-                        xanchor="center",
-                        yanchor="top"
-                    ),
-                    margin=dict(b=150)           # Much more bottom margin
-                )
-                
-                st.plotly_chart(tier_perf_fig, use_container_width=True)
-            else:
-                st.info("Risk or performance metrics not available in the current dataset")
+        # Risk Matrix by Tier
+        if "RiskCategory" in supplier_performance.columns and "RiskScore" in supplier_performance.columns:
+            # Tier-based risk matrix
+            st.write("Risk Distribution by Tier")
+            
+            tier_risk_fig = px.scatter(
+                supplier_performance,
+                x="RiskScore",
+                y="TierRanking",
+                color="RiskCategory",
+                size="RiskScore",
+                hover_name="SupplierName",
+                title="Risk Profile by Supplier Tier",
+                color_discrete_sequence=px.colors.qualitative.Set1,
+                labels={"RiskScore": "Risk Score (Higher = More Risk)", "TierRanking": "Supplier Tier", "RiskCategory": "Risk Category"}
+            )
+            
+            # Position the legend directly below the chart with simple formatting
+            tier_risk_fig.update_layout(
+                height=500,  # Taller chart
+                legend=dict(
+                    orientation="h",         # Horizontal orientation
+                    y=-0.4,                  # More space below
+                    x=0.5,                   # Centered
+                    xanchor="center",
+                    yanchor="top",
+                    font=dict(size=9)        # Smaller font
+                ),
+                margin=dict(b=150)           # Much more bottom margin
+            )
+            
+            st.plotly_chart(tier_risk_fig, use_container_width=True, key="risk_tier_risk_chart")
+        elif any(metric in supplier_performance.columns for metric in perf_metrics):
+            # If we have performance metrics but no risk scores, show performance by tier
+            available_metric = next(metric for metric in perf_metrics if metric in supplier_performance.columns)
+            
+            tier_perf_fig = px.box(
+                supplier_performance,
+                x="TierRanking",
+                y=available_metric,
+                color="TierRanking",
+                title=f"Performance Distribution by Tier ({available_metric})",
+                labels={"TierRanking": "Supplier Tier"}
+            )
+            
+            # Position the legend directly below the chart with simple formatting
+            tier_perf_fig.update_layout(
+                height=500,  # Taller chart
+                legend=dict(
+                    orientation="h",         # Horizontal orientation
+                    y=-0.4,                  # More space below
+                    x=0.5,                   # Centered
+                    xanchor="center",
+                    yanchor="top"
+                ),
+                margin=dict(b=150)           # Much more bottom margin
+            )
+            
+            st.plotly_chart(tier_perf_fig, use_container_width=True, key="risk_tier_perf_chart")
+        else:
+            st.info("Risk or performance metrics not available in the current dataset")
         
         # Payment Terms Analysis Section
         st.subheader("Payment Terms Analysis")
@@ -341,19 +796,18 @@ def show(session_state):
         if has_payment_terms:
             # Group suppliers by payment terms
             payment_terms_data = supplier_performance.dropna(subset=["PaymentTerms"])
-            payment_terms_counts = payment_terms_data.groupby("PaymentTerms").size().reset_index(name="Count")
-            payment_terms_counts = payment_terms_counts.sort_values("Count", ascending=False)
+            term_counts = payment_terms_data["PaymentTerms"].value_counts()
+            term_counts = term_counts[term_counts > 0]
+            payment_terms_counts = term_counts.rename_axis("PaymentTerms").reset_index(name="Count")
+            most_common_terms = term_counts.idxmax()
             
             # Extract days from payment terms for analysis
-            payment_terms_data["PaymentDays"] = 0
-            for idx, row in payment_terms_data.iterrows():
-                payment_terms = row["PaymentTerms"]
-                if isinstance(payment_terms, str) and "Net" in payment_terms:
-                    try:
-                        payment_days = int(''.join(filter(str.isdigit, payment_terms)))
-                        payment_terms_data.at[idx, "PaymentDays"] = payment_days
-                    except:
-                        pass
+            # Only "Net N" style terms carry a day count; anything else counts as 0 days
+            payment_terms_data = payment_terms_data.assign(
+                PaymentDays=payment_terms_data["PaymentTerms"].astype(str)
+                .str.extract(r"Net\D*(\d+)", expand=False)
+                .astype("float").fillna(0).astype("int32")
+            )
             
             # Calculate average payment days
             avg_payment_days = payment_terms_data["PaymentDays"].mean()
@@ -368,7 +822,7 @@ def show(session_state):
                 # Payment term statistics
                 payment_stats = {
                     "Average Payment Days": f"{avg_payment_days:.1f}",
-                    "Most Common Terms": payment_terms_counts.iloc[0]["PaymentTerms"],
+                    "Most Common Terms": most_common_terms,
                     "Suppliers with No Terms": len(supplier_performance) - len(payment_terms_data)
                 }
                 
@@ -408,11 +862,11 @@ def show(session_state):
                 )
                 
                 fig.update_traces(textposition='outside')
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True, key="risk_payment_terms_chart")
                 
                 # If we have tier data, show payment terms by tier
                 if "TierRanking" in supplier_performance.columns:
-                    payment_by_tier = payment_terms_data.groupby(["TierRanking"])["PaymentDays"].mean().reset_index()
+                    payment_by_tier = payment_terms_data.groupby(["TierRanking"], observed=True)["PaymentDays"].mean().reset_index()
                     payment_by_tier = payment_by_tier.sort_values("PaymentDays", ascending=False)
                     
                     tier_fig = px.bar(
@@ -440,7 +894,7 @@ def show(session_state):
                     )
                     
                     tier_fig.update_traces(textposition='outside')
-                    st.plotly_chart(tier_fig, use_container_width=True)
+                    st.plotly_chart(tier_fig, use_container_width=True, key="risk_payment_tier_chart")
                     
                     # Add strategic insights
                     if payment_by_tier["TierRanking"].nunique() > 1:
@@ -478,7 +932,7 @@ def show(session_state):
                             metric=metric,
                             title=f"Top Suppliers by {tab_names[i]} Performance"
                         )
-                        st.plotly_chart(fig, use_container_width=True)
+                        st.plotly_chart(fig, use_container_width=True, key=f"risk_{metric}_chart")
                     except Exception as e:
                         st.error(f"Unable to create chart for {tab_names[i]}: {str(e)}")
         else:
@@ -488,309 +942,31 @@ def show(session_state):
         # Performance Trend Analysis
         st.subheader("Performance Trend Analysis")
         
-        # Check if we have performance data and it's not empty
-        if not performance_data.empty and len(supplier_performance) > 0 and "SupplierID" in supplier_performance.columns:
-            # Supplier selector for trend analysis
-            try:
-                selected_supplier_id = st.selectbox(
-                    "Select Supplier for Trend Analysis:",
-                    options=supplier_performance["SupplierID"].tolist(),
-                    format_func=lambda x: supplier_performance[supplier_performance["SupplierID"] == x]["SupplierName"].iloc[0] 
-                        if "SupplierName" in supplier_performance.columns 
-                        else x
-                )
-                
-                # Get performance history for selected supplier
-                supplier_history = performance_data[performance_data["SupplierID"] == selected_supplier_id]
-                
-                # Determine time dimension column
-                time_dimension = None
-                for col in ["Quarter", "EvaluationDate", "Date", "Period"]:
-                    if col in supplier_history.columns:
-                        time_dimension = col
-                        break
-                
-                if len(supplier_history) > 0 and time_dimension is not None:
-                    # Determine available metrics
-                    available_metrics = []
-                    for metric in ["OverallScore", "DeliveryScore", "QualityScore", "ResponsivenessScore", 
-                                  "CostScore", "InnovationScore", "SustainabilityScore"]:
-                        if metric in supplier_history.columns:
-                            available_metrics.append(metric)
-                    
-                    if available_metrics:
-                        # Create a long format dataframe for the line chart
-                        history_long = pd.melt(
-                            supplier_history,
-                            id_vars=["SupplierID", time_dimension],
-                            value_vars=available_metrics,
-                            var_name="Metric",
-                            value_name="Score"
-                        )
-            
-                        # Create a more readable label for the metrics
-                        metric_labels = {}
-                        for metric in available_metrics:
-                            # Convert camelCase to Space Separated Text
-                            label = metric.replace("Score", "").replace("_", " ").title()
-                            metric_labels[metric] = label
-                        
-                        history_long["Metric"] = history_long["Metric"].replace(metric_labels)
-                        
-                        # Get supplier name for title
-                        if "SupplierName" in supplier_performance.columns:
-                            supplier_name = supplier_performance[supplier_performance["SupplierID"] == selected_supplier_id]["SupplierName"].iloc[0]
-                        else:
-                            supplier_name = f"Supplier {selected_supplier_id}"
-                        
-                        # Create the trend chart
-                        fig5 = px.line(
-                            history_long,
-                            x=time_dimension,
-                            y="Score",
-                            color="Metric",
-                            title=f"Performance Trend for {supplier_name}",
-                            labels={"Score": "Performance Score", time_dimension: time_dimension, "Metric": "Metric"},
-                            markers=True
-                        )
-                        
-                        # Auto-scale y-axis based on data range, with some padding
-                        max_score = history_long["Score"].max()
-                        min_score = history_long["Score"].min()
-                        y_range = [max(0, min_score - 0.5), min(10.5, max_score + 0.5)]
-                        
-                        fig5.update_layout(
-                            yaxis=dict(range=y_range),
-                            hovermode="x unified"
-                        )
-                        
-                        st.plotly_chart(fig5, use_container_width=True)
-                    else:
-                        st.info("No performance metrics available for trend analysis")
-                else:
-                    st.info(f"No performance history available for this supplier")
-            except Exception as e:
-                st.error(f"Error creating performance trend chart: {str(e)}")
-        else:
-            st.info("Performance data is required for trend analysis. Please upload supplier performance data.")
+        # Runs as a fragment so picking another supplier only redraws the trend chart
+        _trend_section(performance_data, supplier_performance)
         
         # Public Risk Indicators
         st.subheader("Public Risk Indicators (Simulated)")
         
-        # Create simulated risk indicators
-        supplier_performance["FinancialRisk"] = np.random.uniform(1, 10, len(supplier_performance))
-        supplier_performance["ESGRisk"] = np.random.uniform(1, 10, len(supplier_performance))
-        supplier_performance["ComplianceRisk"] = np.random.uniform(1, 10, len(supplier_performance))
-        supplier_performance["GeopoliticalRisk"] = np.random.uniform(1, 10, len(supplier_performance))
-        
-        # Create a risk score (lower is better for risk scores)
-        supplier_performance["RiskScore"] = (
-            supplier_performance["FinancialRisk"] * 0.4 +
-            supplier_performance["ESGRisk"] * 0.3 +
-            supplier_performance["ComplianceRisk"] * 0.2 +
-            supplier_performance["GeopoliticalRisk"] * 0.1
-        )
+        supplier_performance = _simulate_risk_indicators(supplier_performance)
         
         # Create two columns layout
         risk_col1, risk_col2 = st.columns(2)
         
         with risk_col1:
             # Create a scatter plot of performance vs risk
-            fig6 = px.scatter(
-                supplier_performance,
-                x="RiskScore",
-                y="OverallScore",
-                color="Category",
-                size="AnnualRevenue",
-                hover_name="SupplierName",
-                title="Supplier Performance vs. Risk Matrix",
-                labels={
-                    "RiskScore": "Risk Score (Lower is Better)",
-                    "OverallScore": "Performance Score (Higher is Better)",
-                    "Category": "Category"
-                },
-                custom_data=["SupplierID", "SupplierName"]
-            )
-            
-            # Directly position legend at bottom with clear settings
-            fig6.update_layout(
-                legend=dict(
-                    orientation="h",       # Horizontal legend
-                    yanchor="top",         # Anchor from top of legend box
-                    y=-0.3,                # Position well below the chart
-                    xanchor="center",      # Center anchor
-                    x=0.5                  # Center position
-                ),
-                margin=dict(l=20, r=20, t=50, b=100),  # Extra bottom margin
-                height=550                 # Taller chart
-            )
-            
-            # Add quadrant lines
-            fig6.add_hline(y=7.5, line_width=1, line_dash="dash", line_color="gray")
-            fig6.add_vline(x=5, line_width=1, line_dash="dash", line_color="gray")
-            
-            # Add quadrant annotations
-            fig6.add_annotation(x=2.5, y=8.75, text="Strategic Partners", showarrow=False, font=dict(size=12, color="green"))
-            fig6.add_annotation(x=7.5, y=8.75, text="Performance Concerns", showarrow=False, font=dict(size=12, color="orange"))
-            fig6.add_annotation(x=2.5, y=3.75, text="Reliable", showarrow=False, font=dict(size=12, color="blue"))
-            fig6.add_annotation(x=7.5, y=3.75, text="High Risk", showarrow=False, font=dict(size=12, color="red"))
-            
-            st.plotly_chart(fig6, use_container_width=True)
+            fig6 = _risk_matrix_figure(supplier_performance)
+            st.plotly_chart(go.Figure(fig6, _validate=False), use_container_width=True, key="risk_matrix_chart")
         
         with risk_col2:
             # Top 10 suppliers by risk
-            high_risk_suppliers = supplier_performance.sort_values("RiskScore", ascending=False).head(10)
-            
-            fig7 = px.bar(
-                high_risk_suppliers,
-                y="SupplierName",
-                x="RiskScore",
-                orientation="h",
-                color="RiskScore",
-                title="Top 10 Suppliers by Risk Score",
-                labels={"SupplierName": "Supplier", "RiskScore": "Risk Score"},
-                color_continuous_scale="Oranges_r"  # Reversed scale since higher risk is worse
-            )
-            
-            fig7.update_layout(yaxis={'categoryorder': 'total ascending'})
-            st.plotly_chart(fig7, use_container_width=True)
+            fig7 = _top_risk_figure(supplier_performance)
+            st.plotly_chart(go.Figure(fig7, _validate=False), use_container_width=True, key="risk_top_suppliers_chart")
         
         # Detailed Risk Profile for a selected supplier
         st.subheader("Detailed Risk Profile")
         
-        selected_supplier_id_risk = st.selectbox(
-            "Select Supplier for Detailed Risk Analysis:",
-            options=supplier_performance["SupplierID"].tolist(),
-            format_func=lambda x: supplier_performance[supplier_performance["SupplierID"] == x]["SupplierName"].iloc[0],
-            key="risk_supplier_selector"
-        )
-        
-        # Get the selected supplier data
-        selected_supplier = supplier_performance[supplier_performance["SupplierID"] == selected_supplier_id_risk].iloc[0]
-        
-        # Create columns for risk profile
-        profile_col1, profile_col2 = st.columns(2)
-        
-        with profile_col1:
-            # Create a radar chart for risk dimensions
-            risk_dimensions = ["FinancialRisk", "ESGRisk", "ComplianceRisk", "GeopoliticalRisk"]
-            risk_values = [selected_supplier[dim] for dim in risk_dimensions]
-            
-            fig8 = go.Figure()
-            
-            fig8.add_trace(go.Scatterpolar(
-                r=risk_values,
-                theta=["Financial", "ESG", "Compliance", "Geopolitical"],
-                fill='toself',
-                name='Risk Profile',
-                line_color='orange'
-            ))
-            
-            fig8.update_layout(
-                polar=dict(
-                    radialaxis=dict(
-                        visible=True,
-                        range=[0, 10]
-                    )),
-                showlegend=False,
-                title=f"Risk Profile for {selected_supplier['SupplierName']}"
-            )
-            
-            st.plotly_chart(fig8, use_container_width=True)
-        
-        with profile_col2:
-            # Create a gauge chart for overall risk
-            risk_score = selected_supplier["RiskScore"]
-            
-            fig9 = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=risk_score,
-                title={"text": "Overall Risk Score"},
-                gauge={
-                    'axis': {'range': [0, 10], 'tickwidth': 1},
-                    'bar': {'color': "orange"},
-                    'steps': [
-                        {'range': [0, 3.33], 'color': "green"},
-                        {'range': [3.33, 6.66], 'color': "yellow"},
-                        {'range': [6.66, 10], 'color': "red"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': risk_score
-                    }
-                }
-            ))
-            
-            st.plotly_chart(fig9, use_container_width=True)
-        
-        # Risk alerts and recommendations
-        st.subheader("Risk Alerts & Recommendations")
+        sid_to_row = _supplier_rows(supplier_performance)
         
-        # Simulated risk alerts based on the selected supplier
-        alerts = []
-        
-        if selected_supplier["FinancialRisk"] > 7:
-            alerts.append({
-                "type": "Financial",
-                "severity": "High",
-                "description": f"Financial stability concerns detected for {selected_supplier['SupplierName']}.",
-                "recommendation": "Consider requiring financial guarantees or adjusting payment terms."
-            })
-        
-        if selected_supplier["ESGRisk"] > 7:
-            alerts.append({
-                "type": "ESG",
-                "severity": "High",
-                "description": f"Environmental or social compliance issues identified for {selected_supplier['SupplierName']}.",
-                "recommendation": "Request ESG compliance documentation and schedule an audit."
-            })
-        
-        if selected_supplier["DeliveryScore"] < 6:
-            alerts.append({
-                "type": "Performance",
-                "severity": "Medium",
-                "description": f"Consistent delivery issues with {selected_supplier['SupplierName']}.",
-                "recommendation": "Implement a performance improvement plan with monthly reviews."
-            })
-        
-        if len(alerts) == 0:
-            st.success(f"No significant risk alerts for {selected_supplier['SupplierName']}.")
-        else:
-            for alert in alerts:
-                severity_color = "red" if alert["severity"] == "High" else ("orange" if alert["severity"] == "Medium" else "blue")
-                st.warning(
-                    f"**{alert['type']} Risk - {alert['severity']} Severity**\n\n"
-                    f"{alert['description']}\n\n"
-                    f"**Recommendation:** {alert['recommendation']}"
-                )
-        
-        # AI-Powered Supplier Risk Analysis
-        st.subheader("AI-Powered Supplier Risk Analysis")
-        
-        # Check if LLM is configured
-        llm_provider = st.session_state.get("llm_provider", "None")
-        use_llm = llm_provider != "None"
-        
-        if not use_llm:
-            st.info("Enable AI model configuration in the sidebar to get enhanced supplier risk analysis")
-        else:
-            with st.spinner("Generating advanced risk insights..."):
-                # Get the supplier insights using LLM
-                supplier_insights = generate_supplier_insights(
-                    selected_supplier_id_risk, 
-                    supplier_data, 
-                    performance_data, 
-                    spend_data, 
-                    use_llm=True
-                )
-                
-                # Display the AI-generated insights
-                st.markdown(supplier_insights)
-                
-                # Ask user if they want to generate a risk mitigation plan
-                if st.button("Generate Risk Mitigation Plan", key="gen_risk_plan"):
-                    with st.spinner("Generating comprehensive risk mitigation plan..."):
-                        # This would call an additional LLM function to generate a risk plan
-                        st.success("Risk mitigation plan functionality will be implemented in the next update")
-                        st.info("This feature would generate a detailed risk mitigation plan using AI analysis of the supplier's risk profile")
+        # Runs as a fragment so picking another supplier leaves the charts above untouched
+        _detailed_risk_profile(sid_to_row, supplier_data, performance_data, spend_data, llm_provider)
@@ -1,693 +1,710 @@
 import pandas as pd
 import numpy as np
-from io import StringIO
-from datetime import datetime, timedelta
 import random
 import csv
+from io import StringIO
 import os
+import string
+from functools import lru_cache
+from datetime import date
+
+# Lower-cases ASCII names and turns spaces into dots in a single pass, for building contact emails
+_EMAIL_TABLE = str.maketrans(string.ascii_uppercase + " ", string.ascii_lowercase + ".")
+
+# Sample values shared by several templates
+_BUSINESS_UNITS = (
+    "Water Production & Treatment", "Wastewater Collection & Treatment", 
+    "Network Operations & Maintenance", "Customer Operations & Retail",
+    "IT & Digital Transformation", "Human Resources", "Finance & Regulation",
+    "Procurement & Supply Chain", "Strategic Resource Planning", 
+    "Capital Delivery Programmes", "Asset Management Strategy", "Health, Safety & Environment"
+)
+_REGIONS = ("North", "South", "East", "West", "Central", "International")
+_PAYMENT_TERMS = ("Net 30", "Net 45", "Net 60", "Net 90")
+_CURRENCIES = ("GBP", "USD", "EUR")
+
+# Building blocks for generated supplier names
+_BASE_NAMES = (
+    "Aqua", "Hydro", "Flow", "Pipe", "Clear", "Thames", "Severn", "Kennet", 
+    "Southern", "UK", "London", "Tech", "Digital", "Cyber", "Data", "Enviro", "Chem"
+)
+_SUFFIXES = (
+    "Solutions", "Systems", "Ltd", "Group", "PLC", "Services", "Engineering", 
+    "Technologies", "Dynamics", "Partners", "Consulting", "Advisory", "Water", 
+    "Utilities", "Tech"
+)
+
+# Surnames for contract owners and performance evaluators
+_EMPLOYEE_LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Jones", "Brown", "Davis", "Miller", "Wilson",
+    "Moore", "Taylor", "Anderson", "Thomas", "Jackson", "White", "Harris", "Martin",
+    "Thompson", "Garcia", "Martinez", "Robinson", "Clark", "Rodriguez", "Lewis",
+    "Lee", "Walker", "Hall", "Allen", "Young", "King", "Wright", "Scott", "Green"
+)
+
+def _iter_rows(headers, columns):
+    """Yield the template rows one tuple at a time, in header order"""
+    return zip(*(
+        columns[h].tolist() if hasattr(columns[h], "tolist") else columns[h] for h in headers
+    ))
+
+def _write_csv(headers, columns, out):
+    """Write the columns as CSV rows to the file-like out, or return the CSV text when out is None"""
+    sink = StringIO() if out is None else out
+    writer = csv.writer(sink, lineterminator="\n")
+    writer.writerow(headers)
+    writer.writerows(_iter_rows(headers, columns))
+    if out is None:
+        return sink.getvalue()
+
+@lru_cache(maxsize=8)
+def _seeded_template_csv(draw_columns, seed, day):
+    """CSV text of the template draw_columns makes for seed, memoised per template, seed and day since the dates count back from today"""
+    return _write_csv(*draw_columns(seed), None)
+
+def _emit_template(draw_columns, seed, out):
+    """Write a template to out, or return it as CSV text; seeded templates are drawn once and reused"""
+    if seed is None:
+        return _write_csv(*draw_columns(None), out)
+    text = _seeded_template_csv(draw_columns, seed, date.today())
+    if out is None:
+        return text
+    out.write(text)
+
+def _iter_template(draw_columns, seed):
+    """Yield a template's header row and then its data rows"""
+    headers, columns = draw_columns(seed)
+    yield headers
+    yield from _iter_rows(headers, columns)
+
+# Spend data template columns and sample values
+_SPEND_HEADERS = (
+    "Supplier", "SupplierID", "Category", "SubCategory", "BusinessUnit", 
+    "Date", "Amount", "InvoiceID", "POID", "PaymentTerms", "Currency",
+    "ContractID", "Region", "RiskScore", "SavingsOpportunity"
+)
+_SPEND_CATEGORIES = (
+    "Infrastructure & Assets", "Technology & IT", "Professional & Consultancy Services", 
+    "Operational Consumables", "Business Services", "Utilities & Energy",
+    "Fleet & Logistics", "Maintenance & Repair"
+)
+_SPEND_SUBCATEGORIES = {
+    "Infrastructure & Assets": ("Pipeline Renewal", "Treatment Plant Upgrades", "New Connections", "Reservoir Construction"),
+    "Technology & IT": ("Cloud Hosting", "Cybersecurity Services", "SCADA Systems", "Billing Software Licenses", "Data Analytics Platforms"),
+    "Professional & Consultancy Services": ("Engineering Design", "Legal Counsel", "Financial Audit", "Environmental Impact Assessment", "Leakage Consultancy"),
+    "Operational Consumables": ("Water Treatment Chemicals", "Office Supplies", "Pipe Fittings", "Safety Equipment"),
+    "Business Services": ("HR & Payroll Services", "Training & Development", "Customer Call Centre Services"),
+    "Utilities & Energy": ("Electricity", "Renewable Energy Generation"),
+    "Fleet & Logistics": ("Vehicle Maintenance", "Fuel Costs", "Equipment Rental", "Logistics & Haulage"),
+    "Maintenance & Repair": ("Scheduled Maintenance Works", "Emergency Repairs", "Equipment Servicing")
+}
+
+# Subcategories per category as arrays, in _SPEND_CATEGORIES order, for vectorised sampling
+_SPEND_CATEGORY_ARRAY = np.array(_SPEND_CATEGORIES)
+_SPEND_SUBCATEGORY_ARRAYS = [np.array(_SPEND_SUBCATEGORIES[c]) for c in _SPEND_CATEGORIES]
+_SPEND_SUBCATEGORY_COUNTS = np.array([len(a) for a in _SPEND_SUBCATEGORY_ARRAYS])
 
-def generate_spend_data_template():
-    """Generate a comprehensive spend data template with all required fields"""
-    
-    # Define column headers
-    headers = [
-        "Supplier", "SupplierID", "Category", "SubCategory", "BusinessUnit", 
-        "Date", "Amount", "InvoiceID", "POID", "PaymentTerms", "Currency",
-        "ContractID", "Region", "RiskScore", "SavingsOpportunity"
-    ]
-    
-    # Define sample data ranges
-    categories = [
-        "Infrastructure & Assets", "Technology & IT", "Professional & Consultancy Services", 
-        "Operational Consumables", "Business Services", "Utilities & Energy",
-        "Fleet & Logistics", "Maintenance & Repair"
-    ]
-    
-    subcategories = {
-        "Infrastructure & Assets": ["Pipeline Renewal", "Treatment Plant Upgrades", "New Connections", "Reservoir Construction"],
-        "Technology & IT": ["Cloud Hosting", "Cybersecurity Services", "SCADA Systems", "Billing Software Licenses", "Data Analytics Platforms"],
-        "Professional & Consultancy Services": ["Engineering Design", "Legal Counsel", "Financial Audit", "Environmental Impact Assessment", "Leakage Consultancy"],
-        "Operational Consumables": ["Water Treatment Chemicals", "Office Supplies", "Pipe Fittings", "Safety Equipment"],
-        "Business Services": ["HR & Payroll Services", "Training & Development", "Customer Call Centre Services"],
-        "Utilities & Energy": ["Electricity", "Renewable Energy Generation"],
-        "Fleet & Logistics": ["Vehicle Maintenance", "Fuel Costs", "Equipment Rental", "Logistics & Haulage"],
-        "Maintenance & Repair": ["Scheduled Maintenance Works", "Emergency Repairs", "Equipment Servicing"]
+# Infrastructure and technology have higher amounts
+_SPEND_HIGH_VALUE_CATEGORIES = np.isin(_SPEND_CATEGORY_ARRAY, ["Infrastructure & Assets", "Technology & IT"])
+
+def _spend_template_columns(seed):
+    """Draw the spend template columns, seeding every random source with seed"""
+    
+    # Generate supplier names
+    rng = np.random.default_rng(seed)
+    n_suppliers = 50
+    
+    # Pick every supplier's name shape in one draw: 0 plain, 1 hyphenated, 2 with a surname, 3 a numbered "Insight" variant
+    shapes = rng.choice(4, n_suppliers, p=[0.2, 0.2, 0.4, 0.2])
+    shapes[0] = min(shapes[0], 2)  # The first supplier has no earlier name to vary
+    
+    bases = rng.choice(_BASE_NAMES, n_suppliers)
+    second_bases = rng.choice(_BASE_NAMES, n_suppliers)
+    surnames = rng.choice(["Smith", "Jones", "Williams", "Brown", "Taylor", "Davies", "Evans", "Wilson", "Thomas", "Roberts"], n_suppliers)
+    name_suffixes = rng.choice(_SUFFIXES, n_suppliers)
+    
+    # Build the names one shape class at a time
+    supplier_names = np.empty(n_suppliers, dtype=object)
+    plain, hyphenated, surnamed, insight = (shapes == k for k in range(4))
+    supplier_names[plain] = bases[plain] + " " + name_suffixes[plain]
+    supplier_names[hyphenated] = bases[hyphenated] + " " + second_bases[hyphenated] + "-" + name_suffixes[hyphenated]
+    supplier_names[surnamed] = bases[surnamed] + " " + surnames[surnamed] + " " + name_suffixes[surnamed]
+    
+    # Add variation with numbers for similar suppliers, reusing the leading word of the other names
+    n_insight = int(insight.sum())
+    supplier_names[insight] = (
+        rng.choice(bases[~insight], n_insight) + " Insight " +
+        rng.choice(["Consulting", "Advisory", "Partners"], n_insight) + " " +
+        rng.integers(1, 3, n_insight, endpoint=True).astype(str)
+    )
+    supplier_names = supplier_names.tolist()
+    
+    # Generate random data, drawing each column for all rows at once
+    n_rows = 200
+    
+    # Sample a category index per row, then a subcategory within it by scaling one uniform draw by that category's size
+    cat_idx = rng.integers(0, len(_SPEND_CATEGORIES), n_rows)
+    sub_idx = (rng.random(n_rows) * _SPEND_SUBCATEGORY_COUNTS[cat_idx]).astype(int)
+    
+    category = _SPEND_CATEGORY_ARRAY[cat_idx]
+    subcategory = [_SPEND_SUBCATEGORY_ARRAYS[c][j] for c, j in zip(cat_idx.tolist(), sub_idx.tolist())]
+    
+    # Generate random dates within the last 4 years
+    days_ago = rng.integers(0, 365*4, n_rows, endpoint=True)
+    date = (pd.Timestamp.now() - pd.to_timedelta(days_ago, unit="D")).strftime("%Y-%m-%d")
+    
+    amount = np.where(
+        _SPEND_HIGH_VALUE_CATEGORIES[cat_idx],
+        rng.uniform(50000, 750000, n_rows),
+        rng.uniform(500, 150000, n_rows)
+    ).round().astype(int)
+    
+    risk_score = rng.uniform(1, 100, n_rows).round().astype(int)
+    savings_opportunity = (amount * rng.uniform(0.01, 0.15, n_rows)).round().astype(int)  # 1-15% potential savings
+    
+    # Draw the ID numbers as 32-bit arrays; tolist() hands the formatting loops plain ints
+    supplier_numbers = rng.integers(1000, 9999, n_rows, endpoint=True).tolist()
+    invoice_numbers = rng.integers(0, 1 << 32, n_rows, dtype=np.uint32).tolist()
+    po_numbers = rng.integers(0, 1 << 32, n_rows, dtype=np.uint32).tolist()
+    contract_numbers = rng.integers(0, 1 << 28, n_rows, dtype=np.uint32).tolist()
+    
+    columns = {
+        "Supplier": rng.choice(supplier_names, n_rows),
+        "SupplierID": [f"TW_SUP_{x}" for x in supplier_numbers],
+        "Category": category,
+        "SubCategory": subcategory,
+        "BusinessUnit": rng.choice(_BUSINESS_UNITS, n_rows),
+        "Date": date,
+        "Amount": amount,
+        "InvoiceID": [f"TW_INV_{x:X}" for x in invoice_numbers],
+        "POID": [f"TW_PO_{x:X}" for x in po_numbers],
+        "PaymentTerms": rng.choice(_PAYMENT_TERMS, n_rows),
+        "Currency": rng.choice(_CURRENCIES, n_rows),
+        "ContractID": [f"TW_CON_{x:X}" for x in contract_numbers],
+        "Region": rng.choice(_REGIONS, n_rows),
+        "RiskScore": risk_score,
+        "SavingsOpportunity": savings_opportunity
     }
     
-    business_units = [
-        "Water Production & Treatment", "Wastewater Collection & Treatment", 
-        "Network Operations & Maintenance", "Customer Operations & Retail",
-        "IT & Digital Transformation", "Human Resources", "Finance & Regulation",
-        "Procurement & Supply Chain", "Strategic Resource Planning", 
-        "Capital Delivery Programmes", "Asset Management Strategy", "Health, Safety & Environment"
-    ]
-    
-    regions = ["North", "South", "East", "West", "Central", "International"]
-    
-    payment_terms = ["Net 30", "Net 45", "Net 60", "Net 90"]
-    currencies = ["GBP", "USD", "EUR"]
-    
-    # Generate supplier names and IDs
-    base_names = [
-        "Aqua", "Hydro", "Flow", "Pipe", "Clear", "Thames", "Severn", "Kennet", 
-        "Southern", "UK", "London", "Tech", "Digital", "Cyber", "Data", "Enviro", "Chem"
-    ]
-    
-    suffixes = [
-        "Solutions", "Systems", "Ltd", "Group", "PLC", "Services", "Engineering", 
-        "Technologies", "Dynamics", "Partners", "Consulting", "Advisory", "Water", 
-        "Utilities", "Tech"
-    ]
-    
+    return _SPEND_HEADERS, columns
+
+def generate_spend_data_template(out=None, seed=None):
+    """Generate a comprehensive spend data template with all required fields; written to out when given, otherwise returned as a CSV string. Passing a seed makes the data reproducible"""
+    return _emit_template(_spend_template_columns, seed, out)
+
+def iter_spend_data_rows(seed=None):
+    """Yield the spend data template's header row and then one row per record, without building any CSV text"""
+    return _iter_template(_spend_template_columns, seed)
+
+# Supplier master template columns and sample values
+_SUPPLIER_HEADERS = (
+    "SupplierID", "SupplierName", "Category", "Country", "City", 
+    "ContactName", "ContactEmail", "ContactPhone", "AnnualRevenue", 
+    "PaymentTerms", "Active", "RelationshipStartDate", "TierRanking",
+    "DiversityStatus", "SustainabilityRating", "RiskCategory",
+    "Region", "Latitude", "Longitude"
+)
+_SUPPLIER_CATEGORIES = (
+    "Chemicals Supply", "Pipeline & Network Maintenance", "Water Treatment Plant Operations",
+    "Waste Management & Sludge Treatment", "Mechanical & Electrical Engineering",
+    "Heavy Plant & Equipment Hire", "IT & Technology Solutions", "Facilities Management",
+    "Professional Services (Legal/HR)", "Customer Service Solutions",
+    "Civil Engineering & Construction", "Research & Development", "Leakage Detection Services",
+    "Renewable Energy Solutions", "Environmental Consultancy", "Health & Safety Consultancy",
+    "Engineering Design Services", "Fleet Management & Logistics", "Metering Technology & Services"
+)
+_COUNTRIES = ("United Kingdom", "United States", "Germany", "France", "Netherlands", "Ireland", "Spain")
+_UK_CITIES = (
+    "London", "Manchester", "Birmingham", "Leeds", "Glasgow", "Edinburgh", "Liverpool",
+    "Bristol", "Oxford", "Cambridge", "Reading", "Southampton", "Luton", "Aylesbury",
+    "Guildford", "Chelmsford", "Basingstoke", "Swindon", "Winchester", "Slough", "Maidstone"
+)
+# For simplicity, mapping all international cities to their countries
+_INTERNATIONAL_CITIES = {
+    "United States": ("New York", "Chicago", "Los Angeles", "Boston", "Atlanta", "Dallas"),
+    "Germany": ("Berlin", "Munich", "Frankfurt", "Hamburg", "Cologne"),
+    "France": ("Paris", "Lyon", "Marseille", "Bordeaux", "Lille"),
+    "Netherlands": ("Amsterdam", "Rotterdam", "The Hague", "Utrecht"),
+    "Ireland": ("Dublin", "Cork", "Galway", "Limerick"),
+    "Spain": ("Madrid", "Barcelona", "Valencia", "Seville")
+}
+_TIER_RANKINGS = ("Tier 1", "Tier 2", "Tier 3")
+_DIVERSITY_STATUSES = ("Minority-Owned", "Women-Owned", "Veteran-Owned", "Small Business", "Not Applicable")
+_SUSTAINABILITY_RATINGS = ("AAA", "AA", "A", "BBB", "BB", "B", "CCC", "Not Rated")
+_RISK_CATEGORIES = ("Low", "Medium", "High", "Critical")
+
+# Sample names for contacts
+_CONTACT_FIRST_NAMES = (
+    "John", "Jane", "Michael", "Sarah", "David", "Emma", "James", "Olivia", 
+    "Robert", "Sophia", "William", "Emily", "Richard", "Ava", "Joseph", "Mia",
+    "Thomas", "Charlotte", "Christopher", "Amelia", "Daniel", "Abigail", 
+    "Matthew", "Elizabeth", "Anthony", "Harper", "Mark", "Evelyn", "Donald",
+    "Ella", "Steven", "Grace", "Andrew", "Chloe", "Paul", "Victoria", "Joshua",
+    "Penelope", "Kenneth", "Lily", "Kevin", "Natalie", "Brian", "Samantha", 
+    "George", "Eva", "Timothy", "Anna", "Stephen", "Hannah", "Eric", "Caroline",
+    "Jason", "Alexis", "Liam", "Allison", "Noah", "Gabriella", "Benjamin", 
+    "Maria", "Samuel", "Alice", "Ryan", "Nicole", "Nicholas", "Avery", "Tyler", 
+    "Madison", "Jacob", "Emma", "Ethan", "Rebecca", "Alexander", "Claire", 
+    "Jonathan", "Stella", "Dylan", "Leah", "Adam", "Skylar", "Caleb", "Lila"
+)
+_CONTACT_LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Jones", "Brown", "Davis", "Miller", "Wilson",
+    "Moore", "Taylor", "Anderson", "Thomas", "Jackson", "White", "Harris", "Martin",
+    "Thompson", "Garcia", "Martinez", "Robinson", "Clark", "Rodriguez", "Lewis",
+    "Lee", "Walker", "Hall", "Allen", "Young", "King", "Wright", "Scott", "Green",
+    "Baker", "Adams", "Nelson", "Hill", "Ramirez", "Campbell", "Mitchell", "Roberts",
+    "Carter", "Phillips", "Evans", "Turner", "Torres", "Parker", "Collins", "Edwards",
+    "Stewart", "Flores", "Morris", "Nguyen", "Murphy", "Rivera", "Cook", "Rogers",
+    "Morgan", "Peterson", "Cooper", "Reed", "Bailey", "Bell", "Gomez", "Kelly",
+    "Howard", "Ward", "Cox", "Diaz", "Richardson", "Wood", "Watson", "Brooks",
+    "Bennett", "Gray", "James", "Reyes", "Cruz", "Hughes", "Price", "Myers",
+    "Long", "Foster", "Sanders", "Ross", "Morales", "Powell", "Sullivan", "Russell",
+    "Ortiz", "Jenkins", "Gutierrez", "Perry", "Butler", "Barnes", "Fisher", "Clarke"
+)
+
+def _supplier_master_template_columns(seed):
+    """Draw the supplier master template columns, seeding every random source with seed"""
+    
+    # Draw the independent picks for every supplier in one call each
+    n_suppliers = 150
+    py_rng = random.Random(seed)
+    contact_first_names = py_rng.choices(_CONTACT_FIRST_NAMES, k=n_suppliers)
+    contact_last_names = py_rng.choices(_CONTACT_LAST_NAMES, k=n_suppliers)
+    supplier_categories = py_rng.choices(_SUPPLIER_CATEGORIES, k=n_suppliers)
+    supplier_payment_terms = py_rng.choices(_PAYMENT_TERMS, k=n_suppliers)
+    supplier_tiers = py_rng.choices(_TIER_RANKINGS, k=n_suppliers)
+    supplier_diversity = py_rng.choices(_DIVERSITY_STATUSES, k=n_suppliers)
+    supplier_sustainability = py_rng.choices(_SUSTAINABILITY_RATINGS, k=n_suppliers)
+    supplier_risk = py_rng.choices(_RISK_CATEGORIES, k=n_suppliers)
+    
+    # Draw the numeric columns as whole arrays
+    rng = np.random.default_rng(seed)
+    is_uk = rng.random(n_suppliers) < 0.8  # UK suppliers are more common
+    supplier_active = rng.random(n_suppliers) < 0.85
+    
+    # UK or international coordinates (simplified)
+    latitude = np.where(is_uk, rng.uniform(50.0, 58.0, n_suppliers), rng.uniform(25.0, 60.0, n_suppliers))
+    longitude = np.where(is_uk, rng.uniform(-6.0, 1.8, n_suppliers), rng.uniform(-120.0, 40.0, n_suppliers))
+    
+    annual_revenue = rng.integers(100000, 400000000, n_suppliers, endpoint=True)
+    phone_area = rng.integers(1000, 9999, n_suppliers, endpoint=True)
+    phone_number = rng.integers(100000, 999999, n_suppliers, endpoint=True)
+    
+    # Generate relationship start dates within last 8 years, formatted in one pass
+    relationship_days_ago = rng.integers(365*1, 365*8, n_suppliers, endpoint=True)
+    relationship_start_dates = (pd.Timestamp.now() - pd.to_timedelta(relationship_days_ago, unit="D")).strftime("%Y-%m-%d")
+    
+    # Generate the per-supplier text columns
     supplier_names = []
-    for i in range(50):
-        # Create a mix of single company names and hyphenated names
-        if random.random() < 0.5:
-            name = f"{random.choice(base_names)} {random.choice(['', random.choice(base_names) + '-'])}{random.choice(suffixes)}"
-        else:
-            name = f"{random.choice(base_names)} {random.choice(['Smith', 'Jones', 'Williams', 'Brown', 'Taylor', 'Davies', 'Evans', 'Wilson', 'Thomas', 'Roberts'])} {random.choice(suffixes)}"
-        
-        # Add variation with numbers for similar suppliers
-        if random.random() < 0.2 and i > 0:
-            name = f"{random.choice(supplier_names).split(' ')[0]} Insight {random.choice(['Consulting', 'Advisory', 'Partners'])} {random.randint(1, 3)}"
-        
-        supplier_names.append(name)
-    
-    # Generate random data
-    rows = []
-    for _ in range(200):
-        category = random.choice(categories)
-        subcategory = random.choice(subcategories[category])
-        
-        # Generate a random date within the last 4 years
-        days_ago = random.randint(0, 365*4)
-        date = (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
-        
-        supplier_name = random.choice(supplier_names)
-        supplier_id = f"TW_SUP_{random.randint(1000, 9999)}"
-        
-        # Infrastructure and technology have higher amounts
-        if category in ["Infrastructure & Assets", "Technology & IT"]:
-            amount = round(random.uniform(50000, 750000))
-        else:
-            amount = round(random.uniform(500, 150000))
-        
-        invoice_id = f"TW_INV_{format(random.getrandbits(32), 'X')}"
-        po_id = f"TW_PO_{format(random.getrandbits(32), 'X')}"
-        contract_id = f"TW_CON_{format(random.getrandbits(28), 'X')}"
-        
-        risk_score = round(random.uniform(1, 100))
-        savings_opportunity = round(amount * random.uniform(0.01, 0.15))  # 1-15% potential savings
-        
-        row = [
-            supplier_name,
-            supplier_id,
-            category,
-            subcategory,
-            random.choice(business_units),
-            date,
-            amount,
-            invoice_id,
-            po_id,
-            random.choice(payment_terms),
-            random.choice(currencies),
-            contract_id,
-            random.choice(regions),
-            risk_score,
-            savings_opportunity
-        ]
-        
-        rows.append(row)
-    
-    # Create DataFrame
-    df = pd.DataFrame(rows, columns=headers)
-    
-    # Return as CSV string
-    csv_output = StringIO()
-    df.to_csv(csv_output, index=False)
-    return csv_output.getvalue()
-
-def generate_supplier_master_template():
-    """Generate a comprehensive supplier master data template with all required fields"""
-    
-    # Define column headers
-    headers = [
-        "SupplierID", "SupplierName", "Category", "Country", "City", 
-        "ContactName", "ContactEmail", "ContactPhone", "AnnualRevenue", 
-        "PaymentTerms", "Active", "RelationshipStartDate", "TierRanking",
-        "DiversityStatus", "SustainabilityRating", "RiskCategory",
-        "Region", "Latitude", "Longitude"
-    ]
-    
-    # Sample data
-    categories = [
-        "Chemicals Supply", "Pipeline & Network Maintenance", "Water Treatment Plant Operations",
-        "Waste Management & Sludge Treatment", "Mechanical & Electrical Engineering",
-        "Heavy Plant & Equipment Hire", "IT & Technology Solutions", "Facilities Management",
-        "Professional Services (Legal/HR)", "Customer Service Solutions",
-        "Civil Engineering & Construction", "Research & Development", "Leakage Detection Services",
-        "Renewable Energy Solutions", "Environmental Consultancy", "Health & Safety Consultancy",
-        "Engineering Design Services", "Fleet Management & Logistics", "Metering Technology & Services"
-    ]
-    
-    countries = ["United Kingdom", "United States", "Germany", "France", "Netherlands", "Ireland", "Spain"]
-    
-    uk_cities = [
-        "London", "Manchester", "Birmingham", "Leeds", "Glasgow", "Edinburgh", "Liverpool",
-        "Bristol", "Oxford", "Cambridge", "Reading", "Southampton", "Luton", "Aylesbury",
-        "Guildford", "Chelmsford", "Basingstoke", "Swindon", "Winchester", "Slough", "Maidstone"
-    ]
-    
-    # For simplicity, mapping all international cities to their countries
-    international_cities = {
-        "United States": ["New York", "Chicago", "Los Angeles", "Boston", "Atlanta", "Dallas"],
-        "Germany": ["Berlin", "Munich", "Frankfurt", "Hamburg", "Cologne"],
-        "France": ["Paris", "Lyon", "Marseille", "Bordeaux", "Lille"],
-        "Netherlands": ["Amsterdam", "Rotterdam", "The Hague", "Utrecht"],
-        "Ireland": ["Dublin", "Cork", "Galway", "Limerick"],
-        "Spain": ["Madrid", "Barcelona", "Valencia", "Seville"]
-    }
-    
-    payment_terms = ["Net 30", "Net 45", "Net 60", "Net 90"]
-    tier_rankings = ["Tier 1", "Tier 2", "Tier 3"]
-    diversity_statuses = ["Minority-Owned", "Women-Owned", "Veteran-Owned", "Small Business", "Not Applicable"]
-    sustainability_ratings = ["AAA", "AA", "A", "BBB", "BB", "B", "CCC", "Not Rated"]
-    risk_categories = ["Low", "Medium", "High", "Critical"]
-    regions = ["North", "South", "East", "West", "Central", "International"]
-    
-    # Sample names for contacts
-    first_names = [
-        "John", "Jane", "Michael", "Sarah", "David", "Emma", "James", "Olivia", 
-        "Robert", "Sophia", "William", "Emily", "Richard", "Ava", "Joseph", "Mia",
-        "Thomas", "Charlotte", "Christopher", "Amelia", "Daniel", "Abigail", 
-        "Matthew", "Elizabeth", "Anthony", "Harper", "Mark", "Evelyn", "Donald",
-        "Ella", "Steven", "Grace", "Andrew", "Chloe", "Paul", "Victoria", "Joshua",
-        "Penelope", "Kenneth", "Lily", "Kevin", "Natalie", "Brian", "Samantha", 
-        "George", "Eva", "Timothy", "Anna", "Stephen", "Hannah", "Eric", "Caroline",
-        "Jason", "Alexis", "Liam", "Allison", "Noah", "Gabriella", "Benjamin", 
-        "Maria", "Samuel", "Alice", "Ryan", "Nicole", "Nicholas", "Avery", "Tyler", 
-        "Madison", "Jacob", "Emma", "Ethan", "Rebecca", "Alexander", "Claire", 
-        "Jonathan", "Stella", "Dylan", "Leah", "Adam", "Skylar", "Caleb", "Lila"
-    ]
-    
-    last_names = [
-        "Smith", "Johnson", "Williams", "Jones", "Brown", "Davis", "Miller", "Wilson",
-        "Moore", "Taylor", "Anderson", "Thomas", "Jackson", "White", "Harris", "Martin",
-        "Thompson", "Garcia", "Martinez", "Robinson", "Clark", "Rodriguez", "Lewis",
-        "Lee", "Walker", "Hall", "Allen", "Young", "King", "Wright", "Scott", "Green",
-        "Baker", "Adams", "Nelson", "Hill", "Ramirez", "Campbell", "Mitchell", "Roberts",
-        "Carter", "Phillips", "Evans", "Turner", "Torres", "Parker", "Collins", "Edwards",
-        "Stewart", "Flores", "Morris", "Nguyen", "Murphy", "Rivera", "Cook", "Rogers",
-        "Morgan", "Peterson", "Cooper", "Reed", "Bailey", "Bell", "Gomez", "Kelly",
-        "Howard", "Ward", "Cox", "Diaz", "Richardson", "Wood", "Watson", "Brooks",
-        "Bennett", "Gray", "James", "Reyes", "Cruz", "Hughes", "Price", "Myers",
-        "Long", "Foster", "Sanders", "Ross", "Morales", "Powell", "Sullivan", "Russell",
-        "Ortiz", "Jenkins", "Gutierrez", "Perry", "Butler", "Barnes", "Fisher", "Clarke"
-    ]
-    
-    # Generate supplier data
-    rows = []
-    for i in range(1, 151):
-        supplier_id = f"TW_SUP_{i:04d}"
-        
-        # Generate supplier name
-        base_names = [
-            "Aqua", "Hydro", "Flow", "Pipe", "Clear", "Thames", "Severn", "Kennet", 
-            "Southern", "UK", "London", "Tech", "Digital", "Cyber", "Data", "Enviro", "Chem"
-        ]
-        
-        suffixes = [
-            "Solutions", "Systems", "Ltd", "Group", "PLC", "Services", "Engineering", 
-            "Technologies", "Dynamics", "Partners", "Consulting", "Advisory", "Water", 
-            "Utilities", "Tech"
-        ]
-        
+    supplier_countries = []
+    supplier_cities = []
+    supplier_regions = []
+    contact_names = []
+    contact_emails = []
+    for i in range(n_suppliers):
         # Randomize the supplier name format
-        name_type = random.randint(1, 4)
+        name_type = py_rng.randint(1, 4)
         if name_type == 1:
-            supplier_name = f"{random.choice(base_names)} {random.choice(last_names)} {random.choice(suffixes)}"
+            supplier_name = f"{py_rng.choice(_BASE_NAMES)} {py_rng.choice(_CONTACT_LAST_NAMES)} {py_rng.choice(_SUFFIXES)}"
         elif name_type == 2:
-            supplier_name = f"{random.choice(base_names)} {random.choice(last_names)}-{random.choice(last_names)} {random.choice(suffixes)}"
+            supplier_name = f"{py_rng.choice(_BASE_NAMES)} {py_rng.choice(_CONTACT_LAST_NAMES)}-{py_rng.choice(_CONTACT_LAST_NAMES)} {py_rng.choice(_SUFFIXES)}"
         elif name_type == 3:
-            supplier_name = f"{random.choice(last_names)} & {random.choice(last_names)} {random.choice(['Consulting', 'Advisory', 'Partners'])}"
+            supplier_name = f"{py_rng.choice(_CONTACT_LAST_NAMES)} & {py_rng.choice(_CONTACT_LAST_NAMES)} {py_rng.choice(['Consulting', 'Advisory', 'Partners'])}"
         else:
-            supplier_name = f"{random.choice(base_names)} {random.choice(suffixes)}"
+            supplier_name = f"{py_rng.choice(_BASE_NAMES)} {py_rng.choice(_SUFFIXES)}"
         
         # For a few entries, create named instances
-        if random.random() < 0.1:
-            supplier_name = f"{random.choice(base_names)} Insight {random.choice(['Consulting', 'Advisory', 'Partners'])} {random.randint(1, 3)}"
+        if py_rng.random() < 0.1:
+            supplier_name = f"{py_rng.choice(_BASE_NAMES)} Insight {py_rng.choice(['Consulting', 'Advisory', 'Partners'])} {py_rng.randint(1, 3)}"
         
-        # Randomly choose country with UK being more common
-        if random.random() < 0.8:
+        # Choose a UK or international location
+        if is_uk[i]:
             country = "United Kingdom"
-            city = random.choice(uk_cities)
-            region = random.choice(regions[:-1])  # Exclude "International"
+            city = py_rng.choice(_UK_CITIES)
+            region = py_rng.choice(_REGIONS[:-1])  # Exclude "International"
         else:
-            country = random.choice(countries[1:])  # non-UK countries
-            city = random.choice(international_cities[country])
+            country = py_rng.choice(_COUNTRIES[1:])  # non-UK countries
+            city = py_rng.choice(_INTERNATIONAL_CITIES[country])
             region = "International"
         
-        # Generate UK coordinates (simplified)
-        if country == "United Kingdom":
-            latitude = random.uniform(50.0, 58.0)
-            longitude = random.uniform(-6.0, 1.8)
-        else:
-            # Generate random international coordinates (simplified)
-            latitude = random.uniform(25.0, 60.0)
-            longitude = random.uniform(-120.0, 40.0)
-        
         # Generate contact information
-        contact_name = f"{random.choice(first_names)} {random.choice(last_names)}"
-        contact_email = f"{contact_name.lower().replace(' ', '.')}@{supplier_name.lower().split(' ')[0]}.co.uk"
-        contact_phone = f"+44 {random.randint(1000, 9999)} {random.randint(100000, 999999)}"
-        
-        # Generate company data
-        category = random.choice(categories)
-        annual_revenue = random.randint(100000, 400000000)
-        payment_terms = random.choice(payment_terms)
-        active = random.choices([True, False], weights=[0.85, 0.15])[0]
-        
-        # Generate relationship start date within last 8 years
-        days_ago = random.randint(365*1, 365*8)
-        relationship_start_date = (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
-        
-        # Generate other classification fields
-        tier_ranking = random.choice(tier_rankings)
-        diversity_status = random.choice(diversity_statuses)
-        sustainability_rating = random.choice(sustainability_ratings)
-        risk_category = random.choice(risk_categories)
-        
-        # Create the complete row
-        row = [
-            supplier_id,
-            supplier_name,
-            category,
-            country,
-            city,
-            contact_name,
-            contact_email,
-            contact_phone,
-            annual_revenue,
-            payment_terms,
-            active,
-            relationship_start_date,
-            tier_ranking,
-            diversity_status,
-            sustainability_rating,
-            risk_category,
-            region,
-            latitude,
-            longitude
-        ]
-        
-        rows.append(row)
-    
-    # Create DataFrame
-    df = pd.DataFrame(rows, columns=headers)
-    
-    # Return as CSV string
-    csv_output = StringIO()
-    df.to_csv(csv_output, index=False)
-    return csv_output.getvalue()
-
-def generate_contract_data_template():
-    """Generate a comprehensive contract data template with all required fields"""
-    
-    # Define column headers
-    headers = [
-        "ContractID", "SupplierID", "SupplierName", "Category", "StartDate", 
-        "EndDate", "RenewalDate", "Value", "AnnualValue", "Status", "Owner",
-        "Department", "ContractType", "TerminationNoticePeriod", "AutoRenewal",
-        "EscalationClause", "PaymentTerms", "Currency", "RiskRating"
-    ]
-    
-    # Sample data
-    categories = [
-        "Chemicals Supply", "Pipeline & Network Maintenance", "Water Treatment Plant Operations",
-        "Waste Management & Sludge Treatment", "Mechanical & Electrical Engineering",
-        "Heavy Plant & Equipment Hire", "IT & Technology Solutions", "Facilities Management",
-        "Professional Services", "Customer Service Solutions", "Civil Engineering & Construction",
-        "Research & Development", "Leakage Detection Services", "Renewable Energy Solutions",
-        "Environmental Consultancy", "Health & Safety Consultancy", "Engineering Design"
-    ]
-    
-    statuses = ["Active", "Expired", "Pending Renewal", "In Negotiation", "Terminated"]
-    departments = [
-        "Water Production & Treatment", "Wastewater Collection & Treatment", 
-        "Network Operations & Maintenance", "Customer Operations & Retail",
-        "IT & Digital Transformation", "Human Resources", "Finance & Regulation",
-        "Procurement & Supply Chain", "Strategic Resource Planning", 
-        "Capital Delivery Programmes", "Asset Management Strategy", "Health, Safety & Environment"
-    ]
-    
-    contract_types = ["Fixed Price", "Time & Materials", "Cost Plus", "Framework Agreement", "Service Level Agreement"]
-    notice_periods = ["30 days", "60 days", "90 days", "6 months", "1 year"]
-    escalation_clauses = ["Annual CPI", "Fixed 2%", "Fixed 3%", "Fixed 5%", "No Escalation", "Negotiable"]
-    payment_terms = ["Net 30", "Net 45", "Net 60", "Net 90"]
-    currencies = ["GBP", "USD", "EUR"]
-    
-    # Sample names for contract owners
-    first_names = [
-        "James", "John", "Robert", "Michael", "William", "David", "Richard", "Joseph",
-        "Thomas", "Christopher", "Charles", "Daniel", "Matthew", "Anthony", "Mark",
-        "Donald", "Steven", "Andrew", "Paul", "Joshua", "Mary", "Patricia", "Jennifer",
-        "Linda", "Elizabeth", "Barbara", "Susan", "Jessica", "Sarah", "Karen", "Lisa",
-        "Nancy", "Betty", "Sandra", "Margaret", "Ashley", "Kimberly", "Emily", "Donna"
-    ]
-    
-    last_names = [
-        "Smith", "Johnson", "Williams", "Jones", "Brown", "Davis", "Miller", "Wilson",
-        "Moore", "Taylor", "Anderson", "Thomas", "Jackson", "White", "Harris", "Martin",
-        "Thompson", "Garcia", "Martinez", "Robinson", "Clark", "Rodriguez", "Lewis",
-        "Lee", "Walker", "Hall", "Allen", "Young", "King", "Wright", "Scott", "Green"
-    ]
-    
-    # Generate contracts
-    rows = []
-    for i in range(1, 201):
-        contract_id = f"TW_CON_{i:04d}"
-        
-        # Link to a supplier
-        supplier_id = f"TW_SUP_{random.randint(1, 150):04d}"
-        supplier_name = f"Supplier {supplier_id[7:]}"  # Placeholder - this would normally be looked up
-        
-        # Generate dates
-        years_ago = random.randint(0, 5)
-        months_ago = random.randint(0, 11)
-        
-        start_date = datetime.now() - timedelta(days=(years_ago*365 + months_ago*30))
-        contract_length_years = random.randint(1, 5)
-        end_date = start_date + timedelta(days=contract_length_years*365)
-        renewal_date = end_date - timedelta(days=random.randint(30, 90))  # Typically renew 1-3 months before expiry
-        
-        # Format dates
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
-        renewal_date_str = renewal_date.strftime("%Y-%m-%d")
-        
-        # Generate values
-        annual_value = random.randint(10000, 2000000)
-        value = annual_value * contract_length_years
-        
-        # Determine status based on dates
-        if start_date > datetime.now():
-            status = "Pending"
-        elif end_date < datetime.now():
-            status = "Expired"
-        elif renewal_date < datetime.now():
-            status = "Pending Renewal"
-        else:
-            status = "Active"
-        
-        # Randomly override a few statuses
-        if random.random() < 0.1:
-            status = random.choice(["In Negotiation", "Terminated"])
-        
-        # Generate owner name
-        owner = f"{random.choice(first_names)} {random.choice(last_names)}"
-        
-        # Other contract details
-        department = random.choice(departments)
-        contract_type = random.choice(contract_types)
-        notice_period = random.choice(notice_periods)
-        auto_renewal = random.choice([True, False])
-        escalation_clause = random.choice(escalation_clauses)
-        payment_terms = random.choice(payment_terms)
-        currency = random.choice(currencies)
-        risk_rating = random.randint(1, 100)
-        
-        # Create the complete row
-        row = [
-            contract_id,
-            supplier_id,
-            supplier_name,
-            random.choice(categories),
-            start_date_str,
-            end_date_str,
-            renewal_date_str,
-            value,
-            annual_value,
-            status,
-            owner,
-            department,
-            contract_type,
-            notice_period,
-            auto_renewal,
-            escalation_clause,
-            payment_terms,
-            currency,
-            risk_rating
-        ]
-        
-        rows.append(row)
-    
-    # Create DataFrame
-    df = pd.DataFrame(rows, columns=headers)
-    
-    # Replace placeholder supplier names with more realistic ones
-    supplier_patterns = [
-        "Aqua", "Hydro", "Flow", "Pipe", "Clear", "Thames", "Severn", "Kennet", 
-        "Southern", "UK", "London", "Tech", "Digital", "Cyber", "Data", "Enviro", "Chem"
-    ]
-    
-    suffixes = [
-        "Solutions", "Systems", "Ltd", "Group", "PLC", "Services", "Engineering", 
-        "Dynamics", "Partners", "Consulting", "Advisory", "Water", "Utilities", "Tech"
-    ]
+        contact_name = f"{contact_first_names[i]} {contact_last_names[i]}"
+        contact_email = f"{contact_name.translate(_EMAIL_TABLE)}@{supplier_name.split(' ', 1)[0].translate(_EMAIL_TABLE)}.co.uk"
+        
+        supplier_names.append(supplier_name)
+        supplier_countries.append(country)
+        supplier_cities.append(city)
+        supplier_regions.append(region)
+        contact_names.append(contact_name)
+        contact_emails.append(contact_email)
+    
+    # Collect the output columns
+    columns = {
+        "SupplierID": [f"TW_SUP_{i:04d}" for i in range(1, n_suppliers + 1)],
+        "SupplierName": supplier_names,
+        "Category": supplier_categories,
+        "Country": supplier_countries,
+        "City": supplier_cities,
+        "ContactName": contact_names,
+        "ContactEmail": contact_emails,
+        "ContactPhone": [f"+44 {a} {n}" for a, n in zip(phone_area.tolist(), phone_number.tolist())],
+        "AnnualRevenue": annual_revenue,
+        "PaymentTerms": supplier_payment_terms,
+        "Active": supplier_active,
+        "RelationshipStartDate": relationship_start_dates,
+        "TierRanking": supplier_tiers,
+        "DiversityStatus": supplier_diversity,
+        "SustainabilityRating": supplier_sustainability,
+        "RiskCategory": supplier_risk,
+        "Region": supplier_regions,
+        "Latitude": latitude,
+        "Longitude": longitude
+    }
     
-    for index, row in df.iterrows():
-        supplier_id_num = int(row['SupplierID'][7:])
-        
-        # Use a deterministic pattern based on supplier ID
-        pattern_index = supplier_id_num % len(supplier_patterns)
-        suffix_index = (supplier_id_num // len(supplier_patterns)) % len(suffixes)
-        
-        df.at[index, 'SupplierName'] = f"{supplier_patterns[pattern_index]} {random.choice(['', 'Group ', 'Inc. ', 'Corp. '])}{suffixes[suffix_index]}"
-    
-    # Return as CSV string
-    csv_output = StringIO()
-    df.to_csv(csv_output, index=False)
-    return csv_output.getvalue()
-
-def generate_supplier_performance_template():
-    """Generate a comprehensive supplier performance data template with all required fields"""
-    
-    # Define column headers
-    headers = [
-        "SupplierID", "SupplierName", "EvaluationDate", "EvaluationPeriod", 
-        "QualityScore", "DeliveryScore", "CostScore", "InnovationScore", 
-        "ResponsivenessScore", "SustainabilityScore", "OverallScore",
-        "Category", "BusinessUnit", "Evaluator", "Comments",
-        "ImprovementPlan", "NextReviewDate", "TrendIndicator"
-    ]
-    
-    # Sample data
-    categories = [
-        "Chemicals Supply", "Pipeline & Network Maintenance", "Water Treatment Plant Operations",
-        "Waste Management & Sludge Treatment", "Mechanical & Electrical Engineering",
-        "Heavy Plant & Equipment Hire", "IT & Technology Solutions", "Facilities Management",
-        "Professional Services", "Customer Service Solutions", "Civil Engineering & Construction",
-        "Research & Development", "Leakage Detection Services", "Renewable Energy Solutions"
-    ]
-    
-    business_units = [
-        "Water Production & Treatment", "Wastewater Collection & Treatment", 
-        "Network Operations & Maintenance", "Customer Operations & Retail",
-        "IT & Digital Transformation", "Human Resources", "Finance & Regulation",
-        "Procurement & Supply Chain", "Strategic Resource Planning", 
-        "Capital Delivery Programmes", "Asset Management Strategy", "Health, Safety & Environment"
-    ]
-    
-    evaluation_periods = ["Q1 2023", "Q2 2023", "Q3 2023", "Q4 2023", "Q1 2024", "Q2 2024", "Q3 2024", "Q4 2024", "H1 2023", "H2 2023", "H1 2024", "Annual 2023"]
-    trend_indicators = ["Improving", "Stable", "Declining", "Significantly Improving", "Significantly Declining"]
-    
-    # Sample comments based on overall score
-    comments_excellent = [
-        "Consistently exceeds expectations in all performance areas.",
-        "Outstanding performance, a truly strategic partner.",
-        "Exemplary service delivery with innovative solutions.",
-        "Best-in-class supplier with exceptional quality and delivery.",
-        "Proactive partner delivering significant value above contract requirements."
-    ]
-    
-    comments_good = [
-        "Reliable performance with occasional excellence in key areas.",
-        "Solid service delivery with good communication.",
-        "Consistently meets requirements with some areas of strength.",
-        "Good overall performance with room for improvement in innovation.",
-        "Dependable supplier with strong operational delivery."
-    ]
-    
-    comments_average = [
-        "Meets basic requirements but lacks consistency.",
-        "Acceptable performance with some service delivery issues.",
-        "Standard service with occasional quality concerns.",
-        "Adequate performance but minimal value-added contributions.",
-        "Meets contractual obligations with little additional value."
-    ]
-    
-    comments_poor = [
-        "Frequent service delivery issues requiring intervention.",
-        "Inconsistent quality and reliability causing operational impacts.",
-        "Multiple performance failures requiring formal improvement plan.",
-        "Below standard performance with significant quality issues.",
-        "Poor response times and inadequate problem resolution."
-    ]
-    
-    improvement_plans = [
-        "Weekly performance review meetings for 3 months",
-        "Formal improvement plan with 90-day reassessment",
-        "Corrective action required within 60 days",
-        "Supplier development program participation required",
-        "No improvement plan needed - performance exceeds requirements",
-        "Quality management system review",
-        "Joint process improvement workshops scheduled",
-        "Monthly executive reviews until performance stabilizes",
-        "None required - continue current approach",
-        "Delivery process review and optimization"
-    ]
-    
-    # Sample names for evaluators
-    first_names = [
-        "James", "John", "Robert", "Michael", "William", "David", "Richard", "Joseph",
-        "Thomas", "Christopher", "Charles", "Daniel", "Matthew", "Anthony", "Mark",
-        "Mary", "Patricia", "Jennifer", "Linda", "Elizabeth", "Barbara", "Susan", 
-        "Jessica", "Sarah", "Karen", "Lisa", "Nancy", "Betty", "Sandra", "Margaret"
-    ]
-    
-    last_names = [
-        "Smith", "Johnson", "Williams", "Jones", "Brown", "Davis", "Miller", "Wilson",
-        "Moore", "Taylor", "Anderson", "Thomas", "Jackson", "White", "Harris", "Martin",
-        "Thompson", "Garcia", "Martinez", "Robinson", "Clark", "Rodriguez", "Lewis",
-        "Lee", "Walker", "Hall", "Allen", "Young", "King", "Wright", "Scott", "Green"
-    ]
-    
-    # Generate performance data
-    rows = []
-    for _ in range(500):  # Generate plenty of performance data points
-        supplier_id = f"TW_SUP_{random.randint(1, 150):04d}"
-        
-        # Generate evaluation date within last 2 years
-        days_ago = random.randint(0, 730)
-        evaluation_date = (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
-        
-        # Pick an evaluation period that roughly corresponds to the evaluation date
-        if days_ago < 90:
-            evaluation_period = "Q2 2024"
-        elif days_ago < 180:
-            evaluation_period = "Q1 2024"
-        elif days_ago < 270:
-            evaluation_period = "Q4 2023"
-        elif days_ago < 360:
-            evaluation_period = "Q3 2023"
-        elif days_ago < 450:
-            evaluation_period = "Q2 2023"
-        elif days_ago < 540:
-            evaluation_period = "Q1 2023"
-        elif days_ago < 630:
-            evaluation_period = "Q4 2022"
-        else:
-            evaluation_period = "Q3 2022"
-        
-        # Generate scores (1-10 scale)
-        quality_score = random.randint(3, 10)
-        delivery_score = random.randint(3, 10)
-        cost_score = random.randint(3, 10)
-        innovation_score = random.randint(2, 10)
-        responsiveness_score = random.randint(3, 10)
-        sustainability_score = random.randint(2, 10)
-        
-        # Calculate overall score (weighted average)
-        overall_score = round((quality_score * 0.25 + 
-                               delivery_score * 0.25 + 
-                               cost_score * 0.2 + 
-                               innovation_score * 0.1 + 
-                               responsiveness_score * 0.1 + 
-                               sustainability_score * 0.1), 1)
-        
-        # Select comments based on overall score
-        if overall_score >= 8.5:
-            comment = random.choice(comments_excellent)
-            improvement_plan = "None required - continue current approach"
-            trend = random.choices(["Improving", "Stable", "Significantly Improving"], weights=[0.4, 0.5, 0.1])[0]
-        elif overall_score >= 7.0:
-            comment = random.choice(comments_good)
-            improvement_plan = random.choices(improvement_plans, weights=[0.1, 0.1, 0.1, 0.1, 0.3, 0.1, 0.1, 0.05, 0.05, 0.0])[0]
-            trend = random.choices(["Improving", "Stable", "Declining"], weights=[0.3, 0.6, 0.1])[0]
-        elif overall_score >= 5.0:
-            comment = random.choice(comments_average)
-            improvement_plan = random.choices(improvement_plans, weights=[0.2, 0.2, 0.1, 0.2, 0.0, 0.1, 0.1, 0.05, 0.0, 0.05])[0]
-            trend = random.choices(["Improving", "Stable", "Declining"], weights=[0.2, 0.5, 0.3])[0]
-        else:
-            comment = random.choice(comments_poor)
-            improvement_plan = random.choices(improvement_plans, weights=[0.3, 0.3, 0.2, 0.1, 0.0, 0.05, 0.0, 0.05, 0.0, 0.0])[0]
-            trend = random.choices(["Stable", "Declining", "Significantly Declining"], weights=[0.1, 0.5, 0.4])[0]
-        
-        # Generate next review date (typically 3-6 months after evaluation)
-        next_review_days = random.randint(90, 180)
-        next_review_date = (datetime.now() - timedelta(days=days_ago) + timedelta(days=next_review_days)).strftime("%Y-%m-%d")
-        
-        # Generate evaluator name
-        evaluator = f"{random.choice(first_names)} {random.choice(last_names)}"
-        
-        # Create supplier name pattern based on ID
-        supplier_id_num = int(supplier_id[7:])
-        supplier_prefixes = ["Aqua", "Hydro", "Flow", "Pipe", "Clear", "Thames", "Severn", "Kennet", "Southern", "UK", "London", "Tech", "Digital", "Cyber", "Data", "Enviro", "Chem"]
-        supplier_suffix = ["Solutions", "Systems", "Ltd", "Group", "PLC", "Services", "Engineering", "Dynamics", "Consulting", "Water"]
-        
-        prefix_index = supplier_id_num % len(supplier_prefixes)
-        suffix_index = (supplier_id_num // len(supplier_prefixes)) % len(supplier_suffix)
-        
-        supplier_name = f"{supplier_prefixes[prefix_index]} {random.choice(last_names)} {supplier_suffix[suffix_index]}"
-        
-        # Create the complete row
-        row = [
-            supplier_id,
-            supplier_name,
-            evaluation_date,
-            evaluation_period,
-            quality_score,
-            delivery_score,
-            cost_score,
-            innovation_score,
-            responsiveness_score,
-            sustainability_score,
-            overall_score,
-            random.choice(categories),
-            random.choice(business_units),
-            evaluator,
-            comment,
-            improvement_plan,
-            next_review_date,
-            trend
-        ]
-        
-        rows.append(row)
+    return _SUPPLIER_HEADERS, columns
+
+def generate_supplier_master_template(out=None, seed=None):
+    """Generate a comprehensive supplier master data template with all required fields; written to out when given, otherwise returned as a CSV string. Passing a seed makes the data reproducible"""
+    return _emit_template(_supplier_master_template_columns, seed, out)
+
+def iter_supplier_master_rows(seed=None):
+    """Yield the supplier master template's header row and then one row per record, without building any CSV text"""
+    return _iter_template(_supplier_master_template_columns, seed)
+
+# Contract template columns and sample values
+_CONTRACT_HEADERS = (
+    "ContractID", "SupplierID", "SupplierName", "Category", "StartDate", 
+    "EndDate", "RenewalDate", "Value", "AnnualValue", "Status", "Owner",
+    "Department", "ContractType", "TerminationNoticePeriod", "AutoRenewal",
+    "EscalationClause", "PaymentTerms", "Currency", "RiskRating"
+)
+_CONTRACT_CATEGORIES = (
+    "Chemicals Supply", "Pipeline & Network Maintenance", "Water Treatment Plant Operations",
+    "Waste Management & Sludge Treatment", "Mechanical & Electrical Engineering",
+    "Heavy Plant & Equipment Hire", "IT & Technology Solutions", "Facilities Management",
+    "Professional Services", "Customer Service Solutions", "Civil Engineering & Construction",
+    "Research & Development", "Leakage Detection Services", "Renewable Energy Solutions",
+    "Environmental Consultancy", "Health & Safety Consultancy", "Engineering Design"
+)
+_CONTRACT_TYPES = ("Fixed Price", "Time & Materials", "Cost Plus", "Framework Agreement", "Service Level Agreement")
+_NOTICE_PERIODS = ("30 days", "60 days", "90 days", "6 months", "1 year")
+_ESCALATION_CLAUSES = ("Annual CPI", "Fixed 2%", "Fixed 3%", "Fixed 5%", "No Escalation", "Negotiable")
+_CONTRACT_SUFFIXES = (
+    "Solutions", "Systems", "Ltd", "Group", "PLC", "Services", "Engineering", 
+    "Dynamics", "Partners", "Consulting", "Advisory", "Water", "Utilities", "Tech"
+)
+
+# Sample first names for contract owners
+_OWNER_FIRST_NAMES = (
+    "James", "John", "Robert", "Michael", "William", "David", "Richard", "Joseph",
+    "Thomas", "Christopher", "Charles", "Daniel", "Matthew", "Anthony", "Mark",
+    "Donald", "Steven", "Andrew", "Paul", "Joshua", "Mary", "Patricia", "Jennifer",
+    "Linda", "Elizabeth", "Barbara", "Susan", "Jessica", "Sarah", "Karen", "Lisa",
+    "Nancy", "Betty", "Sandra", "Margaret", "Ashley", "Kimberly", "Emily", "Donna"
+)
+
+def _contract_template_columns(seed):
+    """Draw the contract template columns, seeding every random source with seed"""
+    
+    # Draw the independent picks for every contract in one call each
+    n_contracts = 200
+    py_rng = random.Random(seed)
+    owner_first_names = py_rng.choices(_OWNER_FIRST_NAMES, k=n_contracts)
+    owner_last_names = py_rng.choices(_EMPLOYEE_LAST_NAMES, k=n_contracts)
+    contract_departments = py_rng.choices(_BUSINESS_UNITS, k=n_contracts)
+    contract_type_picks = py_rng.choices(_CONTRACT_TYPES, k=n_contracts)
+    contract_notice_periods = py_rng.choices(_NOTICE_PERIODS, k=n_contracts)
+    contract_auto_renewal = py_rng.choices([True, False], k=n_contracts)
+    contract_escalation = py_rng.choices(_ESCALATION_CLAUSES, k=n_contracts)
+    contract_payment_terms = py_rng.choices(_PAYMENT_TERMS, k=n_contracts)
+    contract_currencies = py_rng.choices(_CURRENCIES, k=n_contracts)
+    contract_categories = py_rng.choices(_CONTRACT_CATEGORIES, k=n_contracts)
+    
+    # Generate dates for all contracts against a single "now"
+    now = pd.Timestamp.now()
+    rng = np.random.default_rng(seed)
+    years_ago = rng.integers(0, 5, n_contracts, endpoint=True)
+    months_ago = rng.integers(0, 11, n_contracts, endpoint=True)
+    contract_length_years = rng.integers(1, 5, n_contracts, endpoint=True)
+    
+    start_dates = now - pd.to_timedelta(years_ago*365 + months_ago*30, unit="D")
+    end_dates = start_dates + pd.to_timedelta(contract_length_years*365, unit="D")
+    renewal_dates = end_dates - pd.to_timedelta(rng.integers(30, 90, n_contracts, endpoint=True), unit="D")  # Typically renew 1-3 months before expiry
+    
+    # Generate values
+    annual_values = rng.integers(10000, 2000000, n_contracts, endpoint=True)
+    values = annual_values * contract_length_years
+    risk_ratings = rng.integers(1, 100, n_contracts, endpoint=True)
+    
+    # Format dates
+    start_date_strs = start_dates.strftime("%Y-%m-%d")
+    end_date_strs = end_dates.strftime("%Y-%m-%d")
+    renewal_date_strs = renewal_dates.strftime("%Y-%m-%d")
+    
+    # Link each contract to a supplier
+    supplier_id_num = rng.integers(1, 150, n_contracts, endpoint=True)
+    
+    # Determine status based on dates
+    statuses = np.select(
+        [start_dates > now, end_dates < now, renewal_dates < now],
+        ["Pending", "Expired", "Pending Renewal"],
+        default="Active"
+    )
+    
+    # Randomly override a few statuses
+    override = rng.random(n_contracts) < 0.1
+    statuses[override] = rng.choice(["In Negotiation", "Terminated"], int(override.sum()))
+    
+    # Give suppliers realistic names, using a deterministic pattern based on supplier ID, built for all rows at once
+    pattern_index = supplier_id_num % len(_BASE_NAMES)
+    suffix_index = (supplier_id_num // len(_BASE_NAMES)) % len(_CONTRACT_SUFFIXES)
+    
+    middles = rng.choice(["", "Group ", "Inc. ", "Corp. "], n_contracts)
+    supplier_names = np.array(_BASE_NAMES)[pattern_index] + " " + middles + np.array(_CONTRACT_SUFFIXES)[suffix_index]
+    
+    # Collect the output columns
+    columns = {
+        "ContractID": [f"TW_CON_{i:04d}" for i in range(1, n_contracts + 1)],
+        "SupplierID": [f"TW_SUP_{x:04d}" for x in supplier_id_num.tolist()],
+        "SupplierName": supplier_names,
+        "Category": contract_categories,
+        "StartDate": start_date_strs,
+        "EndDate": end_date_strs,
+        "RenewalDate": renewal_date_strs,
+        "Value": values,
+        "AnnualValue": annual_values,
+        "Status": statuses,
+        "Owner": [f"{first} {last}" for first, last in zip(owner_first_names, owner_last_names)],
+        "Department": contract_departments,
+        "ContractType": contract_type_picks,
+        "TerminationNoticePeriod": contract_notice_periods,
+        "AutoRenewal": contract_auto_renewal,
+        "EscalationClause": contract_escalation,
+        "PaymentTerms": contract_payment_terms,
+        "Currency": contract_currencies,
+        "RiskRating": risk_ratings
+    }
     
-    # Create DataFrame
-    df = pd.DataFrame(rows, columns=headers)
+    return _CONTRACT_HEADERS, columns
+
+def generate_contract_data_template(out=None, seed=None):
+    """Generate a comprehensive contract data template with all required fields; written to out when given, otherwise returned as a CSV string. Passing a seed makes the data reproducible"""
+    return _emit_template(_contract_template_columns, seed, out)
+
+def iter_contract_data_rows(seed=None):
+    """Yield the contract data template's header row and then one row per record, without building any CSV text"""
+    return _iter_template(_contract_template_columns, seed)
+
+# Supplier performance template columns and sample values
+_PERFORMANCE_HEADERS = (
+    "SupplierID", "SupplierName", "EvaluationDate", "EvaluationPeriod", 
+    "QualityScore", "DeliveryScore", "CostScore", "InnovationScore", 
+    "ResponsivenessScore", "SustainabilityScore", "OverallScore",
+    "Category", "BusinessUnit", "Evaluator", "Comments",
+    "ImprovementPlan", "NextReviewDate", "TrendIndicator"
+)
+_PERFORMANCE_CATEGORIES = (
+    "Chemicals Supply", "Pipeline & Network Maintenance", "Water Treatment Plant Operations",
+    "Waste Management & Sludge Treatment", "Mechanical & Electrical Engineering",
+    "Heavy Plant & Equipment Hire", "IT & Technology Solutions", "Facilities Management",
+    "Professional Services", "Customer Service Solutions", "Civil Engineering & Construction",
+    "Research & Development", "Leakage Detection Services", "Renewable Energy Solutions"
+)
+_PERFORMANCE_SUFFIXES = ("Solutions", "Systems", "Ltd", "Group", "PLC", "Services", "Engineering", "Dynamics", "Consulting", "Water")
+_IMPROVEMENT_PLANS = (
+    "Weekly performance review meetings for 3 months",
+    "Formal improvement plan with 90-day reassessment",
+    "Corrective action required within 60 days",
+    "Supplier development program participation required",
+    "No improvement plan needed - performance exceeds requirements",
+    "Quality management system review",
+    "Joint process improvement workshops scheduled",
+    "Monthly executive reviews until performance stabilizes",
+    "None required - continue current approach",
+    "Delivery process review and optimization"
+)
+
+def _cumulative_weights(weights):
+    """Normalised cumulative weights, for inverse-CDF sampling against uniform draws"""
+    cum = np.cumsum(weights)
+    return cum / cum[-1]
+
+# Overall score bands: below 5 poor, 5 to 7 average, 7 to 8.5 good, 8.5 and above excellent
+_SCORE_BAND_EDGES = np.array([5.0, 7.0, 8.5])
+
+# Improvement plan and trend odds per score band, one row per band from poor to excellent
+_IMPROVEMENT_PLAN_ARRAY = np.array(_IMPROVEMENT_PLANS)
+_IMPROVEMENT_PLAN_BAND_CUM = np.array([
+    _cumulative_weights((0.3, 0.3, 0.2, 0.1, 0.0, 0.05, 0.0, 0.05, 0.0, 0.0)),
+    _cumulative_weights((0.2, 0.2, 0.1, 0.2, 0.0, 0.1, 0.1, 0.05, 0.0, 0.05)),
+    _cumulative_weights((0.1, 0.1, 0.1, 0.1, 0.3, 0.1, 0.1, 0.05, 0.05, 0.0)),
+    _cumulative_weights((0, 0, 0, 0, 0, 0, 0, 0, 1, 0))  # Always "None required - continue current approach"
+])
+_TREND_BAND_LABELS = np.array([
+    ("Stable", "Declining", "Significantly Declining"),
+    ("Improving", "Stable", "Declining"),
+    ("Improving", "Stable", "Declining"),
+    ("Improving", "Stable", "Significantly Improving")
+])
+_TREND_BAND_CUM = np.array([
+    _cumulative_weights((0.1, 0.5, 0.4)),
+    _cumulative_weights((0.2, 0.5, 0.3)),
+    _cumulative_weights((0.3, 0.6, 0.1)),
+    _cumulative_weights((0.4, 0.5, 0.1))
+])
+
+# Sample comments based on overall score
+_COMMENTS_EXCELLENT = (
+    "Consistently exceeds expectations in all performance areas.",
+    "Outstanding performance, a truly strategic partner.",
+    "Exemplary service delivery with innovative solutions.",
+    "Best-in-class supplier with exceptional quality and delivery.",
+    "Proactive partner delivering significant value above contract requirements."
+)
+_COMMENTS_GOOD = (
+    "Reliable performance with occasional excellence in key areas.",
+    "Solid service delivery with good communication.",
+    "Consistently meets requirements with some areas of strength.",
+    "Good overall performance with room for improvement in innovation.",
+    "Dependable supplier with strong operational delivery."
+)
+_COMMENTS_AVERAGE = (
+    "Meets basic requirements but lacks consistency.",
+    "Acceptable performance with some service delivery issues.",
+    "Standard service with occasional quality concerns.",
+    "Adequate performance but minimal value-added contributions.",
+    "Meets contractual obligations with little additional value."
+)
+_COMMENTS_POOR = (
+    "Frequent service delivery issues requiring intervention.",
+    "Inconsistent quality and reliability causing operational impacts.",
+    "Multiple performance failures requiring formal improvement plan.",
+    "Below standard performance with significant quality issues.",
+    "Poor response times and inadequate problem resolution."
+)
+_COMMENT_BAND_ARRAY = np.array([_COMMENTS_POOR, _COMMENTS_AVERAGE, _COMMENTS_GOOD, _COMMENTS_EXCELLENT])
+
+# Sample first names for evaluators
+_EVALUATOR_FIRST_NAMES = (
+    "James", "John", "Robert", "Michael", "William", "David", "Richard", "Joseph",
+    "Thomas", "Christopher", "Charles", "Daniel", "Matthew", "Anthony", "Mark",
+    "Mary", "Patricia", "Jennifer", "Linda", "Elizabeth", "Barbara", "Susan", 
+    "Jessica", "Sarah", "Karen", "Lisa", "Nancy", "Betty", "Sandra", "Margaret"
+)
+
+def _supplier_performance_template_columns(seed):
+    """Draw the supplier performance template columns, seeding every random source with seed"""
+    
+    # Draw the numeric columns for all evaluations up front
+    n_rows = 500  # Generate plenty of performance data points
+    rng = np.random.default_rng(seed)
+    
+    supplier_id_num = rng.integers(1, 150, n_rows, endpoint=True)
+    
+    # Generate evaluation dates within last 2 years
+    now = pd.Timestamp.now()
+    days_ago = rng.integers(0, 730, n_rows, endpoint=True)
+    evaluation_dates = now - pd.to_timedelta(days_ago, unit="D")
+    
+    # Pick an evaluation period that roughly corresponds to the evaluation date
+    period_bounds = np.array([90, 180, 270, 360, 450, 540, 630])
+    period_labels = np.array(["Q2 2024", "Q1 2024", "Q4 2023", "Q3 2023", "Q2 2023", "Q1 2023", "Q4 2022", "Q3 2022"])
+    evaluation_period = period_labels[np.searchsorted(period_bounds, days_ago, side="right")]
+    
+    # Generate scores (1-10 scale)
+    quality_score = rng.integers(3, 10, n_rows, endpoint=True)
+    delivery_score = rng.integers(3, 10, n_rows, endpoint=True)
+    cost_score = rng.integers(3, 10, n_rows, endpoint=True)
+    innovation_score = rng.integers(2, 10, n_rows, endpoint=True)
+    responsiveness_score = rng.integers(3, 10, n_rows, endpoint=True)
+    sustainability_score = rng.integers(2, 10, n_rows, endpoint=True)
+    
+    # Calculate overall score (weighted average)
+    overall_score = np.round(quality_score * 0.25 + 
+                             delivery_score * 0.25 + 
+                             cost_score * 0.2 + 
+                             innovation_score * 0.1 + 
+                             responsiveness_score * 0.1 + 
+                             sustainability_score * 0.1, 1)
+    
+    # Generate next review dates (typically 3-6 months after evaluation)
+    next_review_dates = evaluation_dates + pd.to_timedelta(rng.integers(90, 180, n_rows, endpoint=True), unit="D")
+    evaluation_dates = evaluation_dates.strftime("%Y-%m-%d")
+    next_review_dates = next_review_dates.strftime("%Y-%m-%d")
+    
+    evaluator_names = rng.choice(_EVALUATOR_FIRST_NAMES, n_rows) + " " + rng.choice(_EMPLOYEE_LAST_NAMES, n_rows)
+    name_last_names = rng.choice(_EMPLOYEE_LAST_NAMES, n_rows)
+    evaluation_categories = rng.choice(_PERFORMANCE_CATEGORIES, n_rows)
+    evaluation_business_units = rng.choice(_BUSINESS_UNITS, n_rows)
+    
+    # Pick comments, improvement plans and trends from the odds of each row's overall score band
+    band = np.searchsorted(_SCORE_BAND_EDGES, overall_score, side="right")
+    comments = _COMMENT_BAND_ARRAY[band, rng.integers(0, _COMMENT_BAND_ARRAY.shape[1], n_rows)]
+    improvement_plan_picks = _IMPROVEMENT_PLAN_ARRAY[(_IMPROVEMENT_PLAN_BAND_CUM[band] <= rng.random(n_rows)[:, None]).sum(axis=1)]
+    trends = _TREND_BAND_LABELS[band, (_TREND_BAND_CUM[band] <= rng.random(n_rows)[:, None]).sum(axis=1)]
+    
+    # Create supplier name pattern based on ID
+    prefix_index = supplier_id_num % len(_BASE_NAMES)
+    suffix_index = (supplier_id_num // len(_BASE_NAMES)) % len(_PERFORMANCE_SUFFIXES)
+    
+    supplier_names = np.array(_BASE_NAMES)[prefix_index] + " " + name_last_names + " " + np.array(_PERFORMANCE_SUFFIXES)[suffix_index]
+    
+    # Collect the output columns
+    columns = {
+        "SupplierID": [f"TW_SUP_{x:04d}" for x in supplier_id_num.tolist()],
+        "SupplierName": supplier_names,
+        "EvaluationDate": evaluation_dates,
+        "EvaluationPeriod": evaluation_period,
+        "QualityScore": quality_score,
+        "DeliveryScore": delivery_score,
+        "CostScore": cost_score,
+        "InnovationScore": innovation_score,
+        "ResponsivenessScore": responsiveness_score,
+        "SustainabilityScore": sustainability_score,
+        "OverallScore": overall_score,
+        "Category": evaluation_categories,
+        "BusinessUnit": evaluation_business_units,
+        "Evaluator": evaluator_names,
+        "Comments": comments,
+        "ImprovementPlan": improvement_plan_picks,
+        "NextReviewDate": next_review_dates,
+        "TrendIndicator": trends
+    }
     
-    # Return as CSV string
-    csv_output = StringIO()
-    df.to_csv(csv_output, index=False)
-    return csv_output.getvalue()
+    return _PERFORMANCE_HEADERS, columns
+
+def generate_supplier_performance_template(out=None, seed=None):
+    """Generate a comprehensive supplier performance data template with all required fields; written to out when given, otherwise returned as a CSV string. Passing a seed makes the data reproducible"""
+    return _emit_template(_supplier_performance_template_columns, seed, out)
+
+def iter_supplier_performance_rows(seed=None):
+    """Yield the supplier performance template's header row and then one row per record, without building any CSV text"""
+    return _iter_template(_supplier_performance_template_columns, seed)
 
 def save_templates_to_csv():
-    """Save all template data to CSV files in the attached_assets directory"""
+    """Save all template data to CSV files in the attached_assets directory, each with a Parquet copy of the same rows"""
     
     templates = {
-        "spend_data_template.csv": generate_spend_data_template(),
-        "supplier_master_data_template.csv": generate_supplier_master_template(),
-        "contract_data_template.csv": generate_contract_data_template(),
-        "supplier_performance_data_template.csv": generate_supplier_performance_template()
+        "spend_data_template": _spend_template_columns,
+        "supplier_master_data_template": _supplier_master_template_columns,
+        "contract_data_template": _contract_template_columns,
+        "supplier_performance_data_template": _supplier_performance_template_columns
     }
     
     dir_path = "attached_assets"
-    for filename, data in templates.items():
-        filepath = os.path.join(dir_path, filename)
+    for name, draw_columns in templates.items():
+        headers, columns = draw_columns(None)
+        
+        filepath = os.path.join(dir_path, f"{name}.csv")
+        # Write straight into the file rather than building the CSV in memory first
         with open(filepath, 'w', newline='') as file:
-            file.write(data)
+            _write_csv(headers, columns, file)
         print(f"Created template file: {filepath}")
+        
+        # Columnar copy for tools that don't need CSV; smaller and much quicker to load
+        parquet_path = os.path.join(dir_path, f"{name}.parquet")
+        pd.DataFrame(columns, columns=list(headers)).to_parquet(parquet_path, compression="snappy", index=False)
+        print(f"Created template file: {parquet_path}")
 
 def generate_requirements_doc():
     """Generate a comprehensive template requirements document"""
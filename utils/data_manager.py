@@ -1,6 +1,21 @@
+import streamlit as st
 import pandas as pd
 import numpy as np
 from io import BytesIO
+from datetime import date
+
+# Rows parsed when checking whether a date-named column really holds dates
+_DATE_PROBE_ROWS = 1000
+
+# Share of probed values that must parse as ISO 8601 for a column to count as dates
+_DATE_PROBE_MIN_PARSED = 0.9
+
+def _to_datetime(values):
+    """Parse dates on pandas' fast ISO 8601 path, falling back to per-value inference for other layouts"""
+    try:
+        return pd.to_datetime(values, format='ISO8601')
+    except (ValueError, TypeError):
+        return pd.to_datetime(values)
 
 def load_data(file, file_type=None):
     """
@@ -8,33 +23,66 @@ def load_data(file, file_type=None):
     
     Parameters:
     file: The uploaded file object
-    file_type: The type of file (csv or excel)
+    file_type: The type of file (csv, excel, parquet or feather)
     
     Returns:
     pd.DataFrame: The loaded data with detected column types in attrs
     """
     if file_type is None:
         # Try to infer file type from name
-        if file.name.endswith('.csv'):
+        file_name = file.name.lower()
+        if file_name.endswith('.csv'):
             file_type = 'csv'
-        elif file.name.endswith('.xlsx'):
+        elif file_name.endswith('.xlsx'):
             file_type = 'excel'
+        elif file_name.endswith('.parquet'):
+            file_type = 'parquet'
+        elif file_name.endswith('.feather'):
+            file_type = 'feather'
         else:
-            raise ValueError("Unsupported file type. Please upload a CSV or Excel file.")
+            raise ValueError("Unsupported file type. Please upload a CSV, Excel, Parquet or Feather file.")
+    
+    # Parsing and type detection are cached on the file's bytes, so Streamlit reruns reuse the first load
+    return _read_file(file.getvalue(), file_type)
+
+@st.cache_data(show_spinner=False)
+def _read_file(file_bytes, file_type):
+    """Parse an uploaded file's bytes and detect its column types"""
+    buffer = BytesIO(file_bytes)
     
     # Load the data
     if file_type == 'csv':
-        df = pd.read_csv(file)
+        df = _read_csv(buffer)
     elif file_type == 'excel':
-        df = pd.read_excel(file)
+        df = pd.read_excel(buffer)
+    elif file_type == 'parquet':
+        df = pd.read_parquet(buffer)
+    elif file_type == 'feather':
+        df = pd.read_feather(buffer)
     else:
-        raise ValueError("Unsupported file type. Please upload a CSV or Excel file.")
+        raise ValueError("Unsupported file type. Please upload a CSV, Excel, Parquet or Feather file.")
     
     # Perform intelligent column type detection
     detect_column_types(df)
     
     return df
 
+def _read_csv(buffer):
+    """Read CSV bytes with pyarrow's multithreaded parser, falling back to the default parser for files it rejects"""
+    try:
+        df = pd.read_csv(buffer, engine='pyarrow')
+    except ValueError:
+        buffer.seek(0)
+        return pd.read_csv(buffer)
+    
+    # pyarrow turns ISO date columns into date objects; keep them as the text the default parser returns
+    for col in df.columns[df.dtypes == object]:
+        values = df[col].dropna()
+        if len(values) and isinstance(values.iloc[0], date):
+            df[col] = df[col].map(date.isoformat, na_action='ignore')
+    
+    return df
+
 def detect_column_types(df):
     """
     Intelligently detect column types and store metadata in dataframe attrs
@@ -56,10 +104,15 @@ def detect_column_types(df):
     # Store unique values for categorical columns
     unique_values = {}
     
+    # Classify dtypes and find empty columns in one pass over the whole frame
+    has_values = df.notna().any()
+    numeric_dtype_cols = set(df.select_dtypes(include=['number', 'bool']).columns)
+    datetime_dtype_cols = set(df.select_dtypes(include=['datetime', 'datetimetz']).columns)
+    
     # Analyze each column
     for col in df.columns:
         # Skip columns with all missing values
-        if df[col].isna().all():
+        if not has_values[col]:
             continue
             
         # Check if column name suggests an ID field
@@ -68,7 +121,7 @@ def detect_column_types(df):
             continue
             
         # Check if column is already numeric
-        if pd.api.types.is_numeric_dtype(df[col]):
+        if col in numeric_dtype_cols:
             # Check if it might be monetary
             col_name_lower = col.lower()
             if any(money_term in col_name_lower for money_term in ['amount', 'price', 'cost', 'value', 'spend', 'budget', 'revenue']):
@@ -76,25 +129,33 @@ def detect_column_types(df):
             else:
                 numeric_cols.append(col)
             continue
+        
+        # Columns already parsed as dates need no probing
+        if col in datetime_dtype_cols:
+            date_cols.append(col)
+            continue
             
         # Try to convert to datetime
         try:
-            # Check if column name suggests a date field
+            # Check if column name suggests a date field, then parse only a leading sample of it
             if any(date_term in col.lower() for date_term in ['date', 'day', 'month', 'year', 'time', 'period', 'quarter']):
-                pd.to_datetime(df[col])
+                sample = df[col].dropna().head(_DATE_PROBE_ROWS)
+                if pd.to_datetime(sample, format='ISO8601', errors='coerce').notna().mean() < _DATE_PROBE_MIN_PARSED:
+                    _to_datetime(sample)
                 date_cols.append(col)
                 continue
         except:
             pass
             
-        # Check number of unique values to determine if categorical
-        n_unique = df[col].nunique()
-        n_total = len(df[col].dropna())
+        # Factorize once to get both the number of unique values and the values themselves
+        codes, uniques = pd.factorize(df[col])
+        n_unique = len(uniques)
+        n_total = int((codes >= 0).sum())
         
         if n_unique <= 50 or (n_unique / n_total <= 0.2 and n_unique <= 100):
             categorical_cols.append(col)
             # Store unique values for filtering
-            unique_values[col] = sorted(df[col].dropna().unique().tolist())
+            unique_values[col] = sorted(uniques.tolist())
         else:
             # Likely a text field
             text_cols.append(col)
@@ -126,12 +187,17 @@ def validate_data(file, data_type):
     try:
         # Determine file type from extension
         file_type = None
-        if file.name.endswith('.csv'):
+        file_name = file.name.lower()
+        if file_name.endswith('.csv'):
             file_type = 'csv'
-        elif file.name.endswith('.xlsx'):
+        elif file_name.endswith('.xlsx'):
             file_type = 'excel'
+        elif file_name.endswith('.parquet'):
+            file_type = 'parquet'
+        elif file_name.endswith('.feather'):
+            file_type = 'feather'
         else:
-            return False, "Unsupported file type. Please upload a CSV or Excel file.", None
+            return False, "Unsupported file type. Please upload a CSV, Excel, Parquet or Feather file.", None
         
         # Load the data
         data = load_data(file, file_type)
@@ -185,7 +251,7 @@ def validate_data(file, data_type):
             for col in schema["date"]:
                 if col in data.columns:
                     try:
-                        data[col] = pd.to_datetime(data[col])
+                        data[col] = _to_datetime(data[col])
                     except:
                         return False, f"Column '{col}' must contain valid dates", None
             